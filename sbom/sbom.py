@@ -14,9 +14,8 @@ import time
 import uuid
 import sbom.sbom_logging as sbom_logging
 from sbom.config import get_config
-from sbom.path_utils import is_relative_to
+from sbom.path_utils import is_relative_to, relative_path
 from sbom.spdx import JsonLdSpdxDocument, SpdxIdGenerator
-from sbom.spdx.core import CreationInfo, SpdxDocument
 from sbom.spdx_graph import SpdxIdGeneratorCollection, build_spdx_graphs
 from sbom.cmd_graph import CmdGraph
 
@@ -50,6 +49,7 @@ def main():
     logging.debug("Start building cmd graph")
     start_time = time.time()
     cmd_graph = CmdGraph.create(config.root_paths, config)
+    cmd_graph_nodes = list(cmd_graph)
     logging.debug(f"Built cmd graph in {time.time() - start_time} seconds")
 
     # Save used files document
@@ -60,12 +60,12 @@ def main():
                 "instead of only source files because source files cannot be "
                 "reliably classified when the source and object trees are identical.",
             )
-            used_files = [os.path.relpath(node.absolute_path, config.src_tree) for node in cmd_graph]
+            used_files = [relative_path(node.absolute_path, config.src_tree) for node in cmd_graph_nodes]
             logging.debug(f"Found {len(used_files)} files in cmd graph.")
         else:
             used_files = [
-                os.path.relpath(node.absolute_path, config.src_tree)
-                for node in cmd_graph
+                relative_path(node.absolute_path, config.src_tree)
+                for node in cmd_graph_nodes
                 if is_relative_to(node.absolute_path, config.src_tree)
                 and not is_relative_to(node.absolute_path, config.obj_tree)
             ]
@@ -97,32 +97,30 @@ def main():
 
     spdx_graphs = build_spdx_graphs(
         cmd_graph,
+        cmd_graph_nodes,
         spdx_id_generators,
         config,
     )
     spdx_id_uuid = uuid.uuid5(
         uuid.NAMESPACE_URL,
         "".join(
-            json.dumps(element.to_dict()) for spdx_graph in spdx_graphs.values() for element in spdx_graph.to_list()
+            json.dumps(element.to_dict()) for spdx_graph in spdx_graphs.values() for element in spdx_graph
         ),
     )
     logging.debug(f"Generated SPDX graph in {time.time() - start_time} seconds")
 
     if not sbom_logging.has_errors() or config.write_output_on_error:
         for kernel_sbom_kind, spdx_graph in spdx_graphs.items():
-            spdx_graph_objects = spdx_graph.to_list()
             # Add warning and error summary to creation info comment
-            creation_info = next(element for element in spdx_graph_objects if isinstance(element, CreationInfo))
-            creation_info.comment = "\n".join([
+            spdx_graph.creation_info.comment = "\n".join([
                 sbom_logging.summarize_warnings(),
                 sbom_logging.summarize_errors(),
             ]).strip()
             # Replace Placeholder uuid with real uuid for spdxIds
-            spdx_document = next(element for element in spdx_graph_objects if isinstance(element, SpdxDocument))
-            for namespaceMap in spdx_document.namespaceMap:
+            for namespaceMap in spdx_graph.spdx_document.namespaceMap:
                 namespaceMap.namespace = namespaceMap.namespace.replace(PLACEHOLDER_UUID, str(spdx_id_uuid))
             # Serialize SPDX graph to JSON-LD
-            spdx_doc = JsonLdSpdxDocument(graph=spdx_graph_objects)
+            spdx_doc = JsonLdSpdxDocument(graph=spdx_graph)
             save_path = os.path.join(config.output_directory, config.spdx_file_names[kernel_sbom_kind])
             spdx_doc.save(save_path, config.prettify_json)
             logging.debug(f"Successfully saved {save_path}")
@@ -112,11 +112,9 @@ class CmdFile:
         Returns:
             list[PathStr]: dependency file paths relative to `obj_tree`.
         """
-        input_files: list[PathStr] = [
-            str(p) for p in parse_inputs_from_commands(self.savedcmd, fail_on_unknown_build_command)
-        ]
+        input_files = parse_inputs_from_commands(self.savedcmd, fail_on_unknown_build_command)
         if self.deps:
-            input_files += [str(p) for p in parse_cmd_file_deps(self.deps)]
+            input_files.extend(parse_cmd_file_deps(self.deps))
         input_files = _expand_resolve_files(input_files, obj_tree)
 
         cmd_file_dependencies: list[PathStr] = []
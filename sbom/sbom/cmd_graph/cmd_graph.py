@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from typing import Iterator
 
 from sbom.cmd_graph.cmd_graph_node import CmdGraphNode, CmdGraphNodeConfig
-from sbom.path_utils import PathStr
+from sbom.path_utils import PathStr, cached_stat
 
 
 @dataclass
@@ -28,6 +28,8 @@ class CmdGraph:
         Returns:
             CmdGraph: A graph of all build dependencies for the given root files.
         """
+        # Do not decide on file existence based on stat results of a previous run
+        cached_stat.cache_clear()
         node_cache: dict[PathStr, CmdGraphNode] = {}
         root_nodes = [CmdGraphNode.create(root_path, config, node_cache) for root_path in root_paths]
         return CmdGraph(root_nodes)
@@ -11,7 +11,7 @@ from sbom import sbom_logging
 from sbom.cmd_graph.cmd_file import CmdFile
 from sbom.cmd_graph.hardcoded_dependencies import get_hardcoded_dependencies
 from sbom.cmd_graph.incbin_parser import parse_incbin_statements
-from sbom.path_utils import PathStr, has_link, is_relative_to
+from sbom.path_utils import PathStr, cached_stat, has_link, is_relative_to
 
 
 @dataclass
@@ -93,7 +93,7 @@ class CmdGraphNode:
         node = CmdGraphNode(target_path_absolute, cmd_file)
         cache[target_path_absolute] = node
 
-        if not os.path.exists(target_path_absolute):
+        if cached_stat(target_path_absolute) is None:
             error_or_warning = (
                 sbom_logging.error
                 if is_relative_to(target_path_absolute, config.obj_tree)
@@ -2,7 +2,6 @@
 # Copyright (C) 2025 TNG Technology Consulting GmbH
 
 import re
-import shlex
 from typing import Callable, Iterator
 
 import sbom.sbom_logging as sbom_logging
@@ -12,6 +11,7 @@ from sbom.cmd_graph.savedcmd_parser.tokenizer import (
     CmdParsingError,
     Option,
     Positional,
+    split_shell_words,
     tokenize_single_command,
     tokenize_single_command_positionals_only,
 )
@@ -21,8 +21,12 @@ CommandParser = Callable[[str], list[PathStr]]
 CommandParserRegistryEntry = tuple[re.Pattern[str], CommandParser]
 
 
+_DD_INPUT_PATTERN = re.compile(r"dd.*?if=(\S+)")
+"""Pattern to match the input file of a dd command (`if=<input>`)"""
+
+
 def _parse_dd_command(command: str) -> list[PathStr]:
-    match = re.match(r"dd.*?if=(\S+)", command)
+    match = _DD_INPUT_PATTERN.match(command)
     if match:
         return [match.group(1)]
     return []
@@ -34,53 +38,6 @@ def _parse_cat_command(command: str) -> list[PathStr]:
     return [p for p in positionals[1:]]
 
 
-def _parse_compound_command(command: str) -> list[PathStr]:
-    compound_command_parsers: list[CommandParserRegistryEntry] = [
-        (re.compile(r"dd\b"), _parse_dd_command),
-        (re.compile(r"cat.*?\|"), lambda c: _parse_cat_command(c.split("|")[0])),
-        (re.compile(r"cat\b[^|>]*$"), _parse_cat_command),
-        (re.compile(r"echo\b"), _parse_noop),
-        (re.compile(r"\S+="), _parse_noop),
-        (re.compile(r"printf\b"), _parse_noop),
-        (re.compile(r"sed\b"), _parse_sed_command),
-        (
-            re.compile(r"(.*/)scripts/bin2c\s*<"),
-            lambda c: [input] if (input := c.split("<")[1].split(">")[0].strip()) != "/dev/null" else [],
-        ),
-        (re.compile(r"^:$"), _parse_noop),
-    ]
-
-    match = re.match(r"\s*[\(\{](.*)[\)\}]\s*>", command, re.DOTALL)
-    if match is None:
-        raise CmdParsingError("No inner commands found for compound command")
-    input_files: list[PathStr] = []
-    inner_commands = split_commands(match.group(1))
-    for inner_command in inner_commands:
-        if isinstance(inner_command, IfBlock):
-            sbom_logging.error(
-                "Skip parsing inner command {inner_command} of compound command because IfBlock is not supported",
-                inner_command=inner_command,
-            )
-            continue
-
-        parser = next((parser for pattern, parser in compound_command_parsers if pattern.match(inner_command)), None)
-        if parser is None:
-            sbom_logging.error(
-                "Skip parsing inner command {inner_command} of compound command because no matching parser was found",
-                inner_command=inner_command,
-            )
-            continue
-        try:
-            input_files += parser(inner_command)
-        except (CmdParsingError, IndexError) as e:
-            sbom_logging.error(
-                "Skip parsing inner command {inner_command} of compound command because of command parsing error: {error_message}",
-                inner_command=inner_command,
-                error_message=str(e),
-            )
-    return input_files
-
-
 def _parse_objcopy_command(command: str) -> list[PathStr]:
     command_parts = tokenize_single_command(command, flag_options=["-S", "-w"])
     positionals = [part.value for part in command_parts if isinstance(part, Positional)]
@@ -130,10 +87,10 @@ def _parse_ar_piped_xargs_command(command: str) -> list[PathStr]:
 
 
 def _parse_gcc_or_clang_command(command: str) -> list[PathStr]:
-    parts = shlex.split(command)
+    parts = split_shell_words(command)
     # compile mode: expect last positional argument ending in a source file extension to be the input file
     for part in reversed(parts):
-        if not part.startswith("-") and any(part.endswith(suffix) for suffix in [".c", ".S", ".dts"]):
+        if part.endswith((".c", ".S", ".dts")) and not part.startswith("-"):
             return [part]
 
     # linking mode: expect all .o files to be the inputs
@@ -141,7 +98,7 @@ def _parse_gcc_or_clang_command(command: str) -> list[PathStr]:
 
 
 def _parse_rustc_command(command: str) -> list[PathStr]:
-    parts = shlex.split(command)
+    parts = split_shell_words(command)
     # expect last positional argument ending in `.rs` to be the input file
     for part in reversed(parts):
         if not part.startswith("-") and part.endswith(".rs"):
@@ -150,7 +107,7 @@ def _parse_rustc_command(command: str) -> list[PathStr]:
 
 
 def _parse_rustdoc_command(command: str) -> list[PathStr]:
-    parts = shlex.split(command)
+    parts = split_shell_words(command)
     # expect last positional argument ending in `.rs` to be the input file
     for part in reversed(parts):
         if not part.startswith("-") and part.endswith(".rs"):
@@ -234,7 +191,7 @@ def _parse_ld_command(command: str) -> list[PathStr]:
 
 
 def _parse_sed_command(command: str) -> list[PathStr]:
-    command_parts = shlex.split(command)
+    command_parts = split_shell_words(command)
     # expect command parts to be ["sed", *, input]
     input = command_parts[-1]
     if input == "/dev/null":
@@ -264,7 +221,7 @@ def _parse_nm_piped_command(command: str) -> list[PathStr]:
 
 
 def _parse_pnm_to_logo_command(command: str) -> list[PathStr]:
-    command_parts = shlex.split(command)
+    command_parts = split_shell_words(command)
     # expect command parts to be ["pnmtologo", <options>, input]
     return [command_parts[-1]]
 
@@ -277,7 +234,7 @@ def _parse_relacheck(command: str) -> list[PathStr]:
 
 def _parse_gen_hyprel_command(command: str) -> list[PathStr]:
     gen_hyprel_command, _ = command.split(">", 1)
-    command_parts = shlex.split(gen_hyprel_command)
+    command_parts = split_shell_words(gen_hyprel_command)
     # expect command_parts to be ["gen-hyprel", input]
     return [command_parts[1]]
 
@@ -308,7 +265,7 @@ def _parse_relocs_command(command: str) -> list[PathStr]:
         # If there's no redirection, we assume it produces no output file and therefore has no input we care about.
         return []
     relocs_command, _ = command.split(">", 1)
-    command_parts = shlex.split(relocs_command)
+    command_parts = split_shell_words(relocs_command)
     # expect command_parts to be ["relocs", options, input]
     return [command_parts[-1]]
 
@@ -320,7 +277,7 @@ def _parse_mk_elfconfig_command(command: str) -> list[PathStr]:
 
 
 def _parse_flex_command(command: str) -> list[PathStr]:
-    parts = shlex.split(command)
+    parts = split_shell_words(command)
     # expect last positional argument ending in `.l` to be the input file
     for part in reversed(parts):
         if not part.startswith("-") and part.endswith(".l"):
@@ -329,7 +286,7 @@ def _parse_flex_command(command: str) -> list[PathStr]:
 
 
 def _parse_bison_command(command: str) -> list[PathStr]:
-    parts = shlex.split(command)
+    parts = split_shell_words(command)
     # expect last positional argument ending in `.y` to be the input file
     for part in reversed(parts):
         if not part.startswith("-") and part.endswith(".y"):
@@ -344,7 +301,7 @@ def _parse_tools_build_command(command: str) -> list[PathStr]:
 
 
 def _parse_extract_cert_command(command: str) -> list[PathStr]:
-    command_parts = shlex.split(command)
+    command_parts = split_shell_words(command)
     # expect command parts to be [path/to/extract-cert, input, output]
     input = command_parts[1]
     if not input:
@@ -353,7 +310,7 @@ def _parse_extract_cert_command(command: str) -> list[PathStr]:
 
 
 def _parse_dtc_command(command: str) -> list[PathStr]:
-    wno_flags = [command_part for command_part in shlex.split(command) if command_part.startswith("-Wno-")]
+    wno_flags = [command_part for command_part in split_shell_words(command) if command_part.startswith("-Wno-")]
     command_parts = tokenize_single_command(command, flag_options=wno_flags)
     positionals = [p.value for p in command_parts if isinstance(p, Positional)]
     # expect positionals to be [path/to/dtc, input]
@@ -361,13 +318,13 @@ def _parse_dtc_command(command: str) -> list[PathStr]:
 
 
 def _parse_bindgen_command(command: str) -> list[PathStr]:
-    command_parts = shlex.split(command)
+    command_parts = split_shell_words(command)
     header_file_input_paths = [part for part in command_parts if part.endswith(".h")]
     return header_file_input_paths
 
 
 def _parse_gen_header(command: str) -> list[PathStr]:
-    command_parts = shlex.split(command)
+    command_parts = split_shell_words(command)
     # expect command parts to be ["python3", path/to/gen_headers.py, ..., "--xml", input]
     i = next((i for i, token in enumerate(command_parts) if token == "--xml"), None)
     if i is None:
@@ -397,6 +354,100 @@ def _parse_gen_kernel_hwcaps_command(command: str) -> list[PathStr]:
     return [positionals[2]]
 
 
+_COMPOUND_COMMAND_PATTERN = re.compile(r"\s*[\(\{](.*)[\)\}]\s*>", re.DOTALL)
+"""Pattern to match the inner commands of a compound command like `(cmd1; cmd2) > output` or `{ cmd1; cmd2; } > output`"""
+
+_COMPOUND_COMMAND_PARSERS: list[CommandParserRegistryEntry] = [
+    (re.compile(r"dd\b"), _parse_dd_command),
+    (re.compile(r"cat.*?\|"), lambda c: _parse_cat_command(c.split("|")[0])),
+    (re.compile(r"cat\b[^|>]*$"), _parse_cat_command),
+    (re.compile(r"echo\b"), _parse_noop),
+    (re.compile(r"\S+="), _parse_noop),
+    (re.compile(r"printf\b"), _parse_noop),
+    (re.compile(r"sed\b"), _parse_sed_command),
+    (
+        re.compile(r"(.*/)scripts/bin2c\s*<"),
+        lambda c: [input] if (input := c.split("<")[1].split(">")[0].strip()) != "/dev/null" else [],
+    ),
+    (re.compile(r"^:$"), _parse_noop),
+]
+
+
+def _parse_compound_command(command: str) -> list[PathStr]:
+    match = _COMPOUND_COMMAND_PATTERN.match(command)
+    if match is None:
+        raise CmdParsingError("No inner commands found for compound command")
+    input_files: list[PathStr] = []
+    inner_commands = split_commands(match.group(1))
+    for inner_command in inner_commands:
+        if isinstance(inner_command, IfBlock):
+            sbom_logging.error(
+                "Skip parsing inner command {inner_command} of compound command because IfBlock is not supported",
+                inner_command=inner_command,
+            )
+            continue
+
+        parser = next((parser for pattern, parser in _COMPOUND_COMMAND_PARSERS if pattern.match(inner_command)), None)
+        if parser is None:
+            sbom_logging.error(
+                "Skip parsing inner command {inner_command} of compound command because no matching parser was found",
+                inner_command=inner_command,
+            )
+            continue
+        try:
+            input_files += parser(inner_command)
+        except (CmdParsingError, IndexError) as e:
+            sbom_logging.error(
+                "Skip parsing inner command {inner_command} of compound command because of command parsing error: {error_message}",
+                inner_command=inner_command,
+                error_message=str(e),
+            )
+    return input_files
+
+
+_INLINE_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"), (re.VERBOSE, "x"), (re.ASCII, "a"))
+"""Pattern flags that can be scoped to a group with the inline `(?flags:...)` syntax"""
+
+_UNCOMBINABLE_SYNTAX_PATTERN = re.compile(r"\\(?:[1-9]|g<)|\(\?P=|\(\?\(|\(\?[aiLmsux]+\)")
+"""Pattern to detect group references, which would refer to other groups once patterns are combined,
+and global inline flags, which would apply to all combined patterns"""
+
+
+def _combine_patterns(patterns: list[re.Pattern[str]]) -> re.Pattern[str] | None:
+    """
+    Combines patterns into one alternation of groups named `_0`, `_1`, ... in pattern order.
+    Since re tries the alternatives in order, the matched group identifies the first pattern that matches.
+
+    Args:
+        patterns: Patterns to combine.
+
+    Returns:
+        The combined pattern, or None if a pattern uses named groups, group references, global inline flags,
+        or flags that cannot be scoped to a group, and therefore cannot be combined safely.
+    """
+    scopable_flags = re.UNICODE
+    for flag, _ in _INLINE_FLAGS:
+        scopable_flags |= flag
+
+    alternatives: list[str] = []
+    for i, pattern in enumerate(patterns):
+        if (
+            not isinstance(pattern.pattern, str)
+            or pattern.groupindex
+            or pattern.flags & ~scopable_flags
+            or _UNCOMBINABLE_SYNTAX_PATTERN.search(pattern.pattern)
+        ):
+            return None
+        flags = "".join(letter for flag, letter in _INLINE_FLAGS if pattern.flags & flag)
+        # A newline ends a trailing comment of a verbose pattern before the group is closed
+        end = "\n" if pattern.flags & re.VERBOSE else ""
+        alternatives.append(f"(?P<_{i}>(?{flags}:{pattern.pattern}{end}))")
+    try:
+        return re.compile("|".join(alternatives))
+    except re.error:
+        return None
+
+
 class CommandParserRegistry:
     """
     Registry mapping command patterns to their input-file parsers.
@@ -404,10 +455,28 @@ class CommandParserRegistry:
 
     def __init__(self, entries: list[CommandParserRegistryEntry]) -> None:
         self._entries = entries
+        self._combined_pattern = _combine_patterns([pattern for pattern, _ in entries])
 
     def __iter__(self) -> Iterator[CommandParserRegistryEntry]:
         return iter(self._entries)
 
+    def match(self, command: str) -> CommandParser | None:
+        """
+        Find the parser of the first entry whose pattern matches the start of the command.
+
+        Args:
+            command: Single command to parse.
+
+        Returns:
+            The matching command parser, or None if no pattern matches.
+        """
+        if self._combined_pattern is None:
+            return next((parser for pattern, parser in self._entries if pattern.match(command)), None)
+        match = self._combined_pattern.match(command)
+        if match is None or match.lastgroup is None:
+            return None
+        return self._entries[int(match.lastgroup[1:])][1]
+
     @staticmethod
     def create() -> "CommandParserRegistry":
         def env_or_default_pattern(env_value: str | None, default_pattern: str) -> str:
@@ -422,6 +491,15 @@ class CommandParserRegistry:
         objcopy_pattern = env_or_default_pattern(Environment.OBJCOPY(), r"([^\s]+-)?objcopy")
         strip_pattern = env_or_default_pattern(Environment.STRIP(), r"([^\s]+-)?strip")
 
+        # Compiled once so that the tool name substitutions below do not go through the re cache on every command
+        cc_prefix = re.compile(rf"^{cc_pattern}\b")
+        ld_prefix = re.compile(rf"^{ld_pattern}\b")
+        ar_prefix = re.compile(rf"^{ar_pattern}\b")
+        ar_xargs = re.compile(rf"xargs {ar_pattern}\b")
+        nm_prefix = re.compile(rf"^{nm_pattern}\b")
+        objcopy_prefix = re.compile(rf"^{objcopy_pattern}\b")
+        strip_prefix = re.compile(rf"^{strip_pattern}\b")
+
         entries: list[CommandParserRegistryEntry] = [
             # Compound commands
             (re.compile(r"\(.*?\)\s*>", re.DOTALL), _parse_compound_command),
@@ -444,34 +522,32 @@ class CommandParserRegistry:
             # Compilers and code generators
             # (C/LLVM toolchain, Rust, Flex/Bison, Bindgen, Perl, etc.)
             (
-                re.compile(rf"^{cc_pattern}\b"),
-                lambda command: _parse_gcc_or_clang_command(re.sub(rf"^{cc_pattern}\b", "gcc", command, count=1)),
+                cc_prefix,
+                lambda command: _parse_gcc_or_clang_command(cc_prefix.sub("gcc", command, count=1)),
             ),
             (
-                re.compile(rf"^{ld_pattern}\b"),
-                lambda command: _parse_ld_command(re.sub(rf"^{ld_pattern}\b", "ld", command, count=1)),
+                ld_prefix,
+                lambda command: _parse_ld_command(ld_prefix.sub("ld", command, count=1)),
             ),
             (
                 re.compile(rf"^printf\b.*\| xargs {ar_pattern}\b"),
-                lambda command: _parse_ar_piped_xargs_command(
-                    re.sub(rf"xargs {ar_pattern}\b", "xargs ar", command, count=1)
-                ),
+                lambda command: _parse_ar_piped_xargs_command(ar_xargs.sub("xargs ar", command, count=1)),
             ),
             (
-                re.compile(rf"^{ar_pattern}\b"),
-                lambda command: _parse_ar_command(re.sub(rf"^{ar_pattern}\b", "ar", command, count=1)),
+                ar_prefix,
+                lambda command: _parse_ar_command(ar_prefix.sub("ar", command, count=1)),
             ),
             (
                 re.compile(rf"^{nm_pattern}\b.*?\|"),
-                lambda command: _parse_nm_piped_command(re.sub(rf"^{nm_pattern}\b", "nm", command, count=1)),
+                lambda command: _parse_nm_piped_command(nm_prefix.sub("nm", command, count=1)),
             ),
             (
-                re.compile(rf"^{objcopy_pattern}\b"),
-                lambda command: _parse_objcopy_command(re.sub(rf"^{objcopy_pattern}\b", "objcopy", command, count=1)),
+                objcopy_prefix,
+                lambda command: _parse_objcopy_command(objcopy_prefix.sub("objcopy", command, count=1)),
             ),
             (
-                re.compile(rf"^{strip_pattern}\b"),
-                lambda command: _parse_strip_command(re.sub(rf"^{strip_pattern}\b", "strip", command, count=1)),
+                strip_prefix,
+                lambda command: _parse_strip_command(strip_prefix.sub("strip", command, count=1)),
             ),
             (re.compile(r".*?rustc\b"), _parse_rustc_command),
             (re.compile(r".*?rustdoc\b"), _parse_rustdoc_command),
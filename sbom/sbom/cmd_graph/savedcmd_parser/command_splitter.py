@@ -41,18 +41,26 @@ def _unwrap_outer_parentheses(s: str) -> str:
     return _unwrap_outer_parentheses(s[1:-1])
 
 
-def _find_first_top_level_command_separator(
-    commands: str, separators: list[str] = [";", "&&"]
-) -> tuple[int | None, int | None]:
+_COMMAND_SPLITTING_CHARACTERS_PATTERN = re.compile(r"""&&|[;'"{}()]""")
+"""Pattern to match the command separators `;` and `&&` and the quote and brace characters that affect splitting"""
+
+
+def _find_first_top_level_command_separator(commands: str) -> tuple[int | None, int | None]:
     def is_escaped(index: int) -> bool:
-        preceding = commands[:index]
-        return (len(preceding) - len(preceding.rstrip("\\"))) % 2 == 1
+        backslash_count = 0
+        while index > 0 and commands[index - 1] == "\\":
+            backslash_count += 1
+            index -= 1
+        return backslash_count % 2 == 1
 
     in_single_quote = False
     in_double_quote = False
     in_curly_braces = 0
     in_braces = 0
-    for i, char in enumerate(commands):
+    # Only visit the characters that can change the state instead of every character
+    for match in _COMMAND_SPLITTING_CHARACTERS_PATTERN.finditer(commands):
+        i = match.start()
+        char = match.group()
         if char == "'" and not in_double_quote and not is_escaped(i):
             # Toggle single quote state (unless inside double quotes or escaped)
             in_single_quote = not in_single_quote
@@ -78,9 +86,8 @@ def _find_first_top_level_command_separator(
             continue
 
         # return found separator position and separator length
-        for separator in separators:
-            if commands[i : i + len(separator)] == separator:
-                return i, len(separator)
+        if char == ";" or char == "&&":
+            return i, len(char)
 
     return None, None
 
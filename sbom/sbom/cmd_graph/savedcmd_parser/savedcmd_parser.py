@@ -47,7 +47,7 @@ def parse_inputs_from_commands(
                 )
             continue
 
-        matched_parser = next((parser for pattern, parser in registry if pattern.match(single_command)), None)
+        matched_parser = registry.match(single_command)
         if matched_parser is None:
             log_error_or_warning(
                 "Skipped parsing command {single_command} because no matching parser was found",
@@ -25,6 +25,67 @@ class Positional:
 _SUBCOMMAND_PATTERN = re.compile(r"\$\$\(([^()]*)\)")
 """Pattern to match $$(...) blocks"""
 
+_SHELL_WHITESPACE_PATTERN = re.compile(r"[ \t\r\n]*")
+"""Pattern to match the whitespace between shell words as defined by `shlex`"""
+
+_SHELL_WORD_PATTERN = re.compile(
+    r"""
+    (?:
+        [^ \t\r\n'"\\]+         # Unquoted characters
+        | '[^']*'               # Single-quoted string
+        | "(?:[^"\\]|\\.)*"     # Double-quoted string with escapes
+        | \\.                   # Escaped character
+    )+
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+"""Pattern to match a single shell word"""
+
+_SHELL_QUOTING_PATTERN = re.compile(r"""'([^']*)'|"((?:[^"\\]|\\.)*)"|\\(.)""", re.DOTALL)
+"""Pattern to match the quoted strings and escaped characters within a shell word"""
+
+_DOUBLE_QUOTED_ESCAPE_PATTERN = re.compile(r"""\\(["\\])""")
+"""Pattern to match the characters that can be escaped within double quotes"""
+
+
+def _unquote_shell_quoting(match: re.Match[str]) -> str:
+    single_quoted, double_quoted, escaped = match.groups()
+    if single_quoted is not None:
+        return single_quoted
+    if double_quoted is not None:
+        return _DOUBLE_QUOTED_ESCAPE_PATTERN.sub(r"\1", double_quoted)
+    return escaped
+
+
+def split_shell_words(command: str) -> list[str]:
+    """
+    Split a command into words like `shlex.split(command)` does in POSIX mode.
+    Unlike `shlex`, words are scanned with regular expressions instead of one character at a time,
+    and only words containing quotes or escapes are unquoted.
+
+    Args:
+        command: Command line string.
+
+    Returns:
+        List of words with quotes and escapes removed.
+
+    Raises:
+        ValueError: If the command contains an unclosed quote or ends with an escape character.
+    """
+    words: list[str] = []
+    position = _SHELL_WHITESPACE_PATTERN.match(command).end()  # type: ignore
+    while position < len(command):
+        match = _SHELL_WORD_PATTERN.match(command, position)
+        if match is None:
+            # Let shlex raise its error for the malformed command
+            return shlex.split(command)
+        word = match.group(0)
+        if "'" in word or '"' in word or "\\" in word:
+            word = _SHELL_QUOTING_PATTERN.sub(_unquote_shell_quoting, word)
+        words.append(word)
+        position = _SHELL_WHITESPACE_PATTERN.match(command, match.end()).end()  # type: ignore
+    return words
+
 
 def tokenize_single_command(command: str, flag_options: list[str] | None = None) -> list[Union[Option, Positional]]:
     """
@@ -43,7 +104,7 @@ def tokenize_single_command(command: str, flag_options: list[str] | None = None)
 
     #  Wrap all $$(...) blocks in double quotes to prevent shlex from splitting them.
     command_with_protected_subcommands = _SUBCOMMAND_PATTERN.sub(lambda m: f'"$$({m.group(1)})"', command)
-    tokens = shlex.split(command_with_protected_subcommands)
+    tokens = split_shell_words(command_with_protected_subcommands)
 
     parsed: list[Option | Positional] = []
     i = 0
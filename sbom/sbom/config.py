@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
 import os
-from typing import Any
+from typing import Any, Literal
 from sbom.path_utils import PathStr
 
 
@@ -16,6 +16,12 @@ class KernelSpdxDocumentKind(Enum):
     OUTPUT = "output"
 
 
+FileHash = Literal["sha256", "gitoid"]
+"""Digest computed for SPDX File elements. 'sha256' is emitted as verifiedUsing Hash, 'gitoid' as contentIdentifier."""
+
+ALL_FILE_HASHES: list[FileHash] = ["sha256", "gitoid"]
+
+
 @dataclass
 class KernelSbomConfig:
     src_tree: PathStr
@@ -77,6 +83,9 @@ class KernelSbomConfig:
     prettify_json: bool
     """Whether to pretty-print generated SPDX JSON documents."""
 
+    file_hashes: list[FileHash]
+    """Digests to compute for each SPDX File element."""
+
 
 def _parse_cli_arguments(parser: argparse.ArgumentParser) -> dict[str, Any]:
     """
@@ -209,6 +218,17 @@ def _parse_cli_arguments(parser: argparse.ArgumentParser) -> dict[str, Any]:
         default=False,
         help="Whether to pretty print the generated spdx.json documents (default: False)",
     )
+    spdx_group.add_argument(
+        "--file-hashes",
+        nargs="+",
+        choices=ALL_FILE_HASHES,
+        default=ALL_FILE_HASHES,
+        help=(
+            "Space-separated list of digests to compute for each SPDX File element.\n"
+            "sha256 is added as verifiedUsing Hash and gitoid as contentIdentifier.\n"
+            "Omitting a digest skips hashing work for large builds. (default: sha256 gitoid)"
+        ),
+    )
 
     args = vars(parser.parse_args())
     return args
@@ -264,6 +284,7 @@ def get_config() -> KernelSbomConfig:
         with open(copying_path, "r", encoding="utf-8") as f:
             package_copyright_text = f.read()
     prettify_json = args["prettify_json"]
+    file_hashes = list(dict.fromkeys(args["file_hashes"]))
 
     # Hardcoded config
     spdx_file_names = {
@@ -293,6 +314,7 @@ def get_config() -> KernelSbomConfig:
         package_version=package_version,
         package_copyright_text=package_copyright_text,
         prettify_json=prettify_json,
+        file_hashes=file_hashes,
     )
 
 
@@ -11,6 +11,35 @@ PathStr = str
 def is_relative_to(path: PathStr, base: PathStr) -> bool:
     return os.path.commonpath([path, base]) == base
 
+
+@lru_cache(maxsize=None)
+def _dir_prefix(base: PathStr) -> str:
+    return base.rstrip(os.sep) + os.sep
+
+
+def tree_relative_path(path: PathStr, base: PathStr) -> PathStr | None:
+    """
+    Returns `path` relative to `base` if `path` lies within `base`, otherwise None.
+    Combines `is_relative_to` and `relative_path` into a single prefix comparison for normalized absolute paths.
+    """
+    if path == base:
+        return "."
+    prefix = _dir_prefix(base)
+    if path.startswith(prefix):
+        return path[len(prefix) :]
+    return None
+
+
+def relative_path(path: PathStr, base: PathStr) -> PathStr:
+    """
+    Returns `path` relative to `base`. Equivalent to `os.path.relpath` for normalized absolute paths,
+    but descendants of `base` are handled by a plain prefix strip instead of splitting and rejoining both paths.
+    """
+    prefix = _dir_prefix(base)
+    if path.startswith(prefix):
+        return path[len(prefix) :]
+    return os.path.relpath(path, base)
+
 @lru_cache(maxsize=None)
 def has_link(path: PathStr) -> bool:
     """Returns True if path or any of its ancestor directories is a symlink. Results are cached to avoid duplicate lstat syscalls."""
@@ -20,3 +49,12 @@ def has_link(path: PathStr) -> bool:
     if parent == path:
         return False
     return has_link(parent)
+
+
+@lru_cache(maxsize=None)
+def cached_stat(path: PathStr) -> os.stat_result | None:
+    """Returns the stat result of path or None if it does not exist. Results are cached for the duration of a run so that building the cmd graph and hashing files share a single stat syscall per path. The cache is cleared at the start of each run by `CmdGraph.create`."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
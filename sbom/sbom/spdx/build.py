@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from sbom.spdx.core import DictionaryEntry, Element, Hash
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Build(Element):
     """https://spdx.github.io/spdx-spec/v3.0.1/model/Build/Classes/Build/"""
 
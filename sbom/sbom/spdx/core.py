@@ -3,7 +3,7 @@
 
 from dataclasses import dataclass, field
 
-from typing import Any, Literal
+from typing import Any, Literal, Sequence
 from sbom.spdx.spdxId import SpdxId
 
 SPDX_SPEC_VERSION = "3.0.1"
@@ -24,7 +24,10 @@ RelationshipType = Literal[
 RelationshipCompleteness = Literal["complete", "incomplete", "noAssertion"]
 
 
-@dataclass
+# All SPDX objects are slots dataclasses to keep the per-object memory of large graphs small.
+# Subclasses overriding to_dict must use the two-argument form of super() because the slots
+# decorator replaces the class, which breaks the implicit class reference of super().
+@dataclass(slots=True)
 class SpdxObject:
     def to_dict(self) -> dict[str, Any]:
         def _to_dict(v: Any):
@@ -33,25 +36,31 @@ class SpdxObject:
         d: dict[str, Any] = {}
         for field_name in self.__dataclass_fields__:
             value = getattr(self, field_name)
-            if value is None or value == [] or value == "":
+            if value is None or value == "":
                 continue
 
             if isinstance(value, Element):
                 d[field_name] = value.spdxId
-            elif isinstance(value, list) and len(value) > 0 and isinstance(value[0], Element):  # type: ignore
-                value: list[Element] = value
-                d[field_name] = [v.spdxId for v in value]
+            elif isinstance(value, (list, tuple)):
+                # sequence fields may hold lists or immutable tuples
+                if len(value) == 0:  # type: ignore
+                    continue
+                if isinstance(value[0], Element):
+                    value: Sequence[Element] = value
+                    d[field_name] = [v.spdxId for v in value]
+                else:
+                    d[field_name] = [_to_dict(v) for v in value]  # type: ignore
             else:
-                d[field_name] = [_to_dict(v) for v in value] if isinstance(value, list) else _to_dict(value)  # type: ignore
+                d[field_name] = _to_dict(value)
         return d
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class IntegrityMethod(SpdxObject):
     """https://spdx.github.io/spdx-spec/v3.0.1/model/Core/Classes/IntegrityMethod/"""
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Hash(IntegrityMethod):
     """https://spdx.github.io/spdx-spec/v3.0.1/model/Core/Classes/Hash/"""
 
@@ -60,7 +69,7 @@ class Hash(IntegrityMethod):
     algorithm: HashAlgorithm
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Element(SpdxObject):
     """https://spdx.github.io/spdx-spec/v3.0.1/model/Core/Classes/Element/"""
 
@@ -72,7 +81,7 @@ class Element(SpdxObject):
     comment: str | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ExternalMap(SpdxObject):
     """https://spdx.github.io/spdx-spec/v3.0.1/model/Core/Classes/ExternalMap/"""
 
@@ -80,7 +89,7 @@ class ExternalMap(SpdxObject):
     externalSpdxId: SpdxId
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class NamespaceMap(SpdxObject):
     """https://spdx.github.io/spdx-spec/v3.0.1/model/Core/Classes/NamespaceMap/"""
 
@@ -89,17 +98,17 @@ class NamespaceMap(SpdxObject):
     namespace: str
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ElementCollection(Element):
     """https://spdx.github.io/spdx-spec/v3.0.1/model/Core/Classes/ElementCollection/"""
 
     type: str = field(init=False, default="ElementCollection")
     element: list[Element] = field(default_factory=list)
-    rootElement: list[Element] = field(default_factory=list)
-    profileConformance: list[ProfileIdentifierType] = field(default_factory=list)
+    rootElement: Sequence[Element] = ()
+    profileConformance: Sequence[ProfileIdentifierType] = ()
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SpdxDocument(ElementCollection):
     """https://spdx.github.io/spdx-spec/v3.0.1/model/Core/Classes/SpdxDocument/"""
 
@@ -108,24 +117,24 @@ class SpdxDocument(ElementCollection):
     namespaceMap: list[NamespaceMap] = field(default_factory=list)
 
     def to_dict(self) -> dict[str, Any]:
-        return {("import" if k == "import_" else k): v for k, v in super().to_dict().items()}
+        return {("import" if k == "import_" else k): v for k, v in super(SpdxDocument, self).to_dict().items()}
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Agent(Element):
     """https://spdx.github.io/spdx-spec/v3.0.1/model/Core/Classes/Agent/"""
 
     type: str = field(init=False, default="Agent")
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SoftwareAgent(Agent):
     """https://spdx.github.io/spdx-spec/v3.0.1/model/Core/Classes/SoftwareAgent/"""
 
     type: str = field(init=False, default="SoftwareAgent")
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CreationInfo(SpdxObject):
     """https://spdx.github.io/spdx-spec/v3.0.1/model/Core/Classes/CreationInfo/"""
 
@@ -137,10 +146,10 @@ class CreationInfo(SpdxObject):
     comment: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        return {("@id" if k == "id" else k): v for k, v in super().to_dict().items()}
+        return {("@id" if k == "id" else k): v for k, v in super(CreationInfo, self).to_dict().items()}
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Relationship(Element):
     """https://spdx.github.io/spdx-spec/v3.0.1/model/Core/Classes/Relationship/"""
 
@@ -151,17 +160,17 @@ class Relationship(Element):
     completeness: RelationshipCompleteness | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        return {("from" if k == "from_" else k): v for k, v in super().to_dict().items()}
+        return {("from" if k == "from_" else k): v for k, v in super(Relationship, self).to_dict().items()}
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Artifact(Element):
     """https://spdx.github.io/spdx-spec/v3.0.1/model/Core/Classes/Artifact/"""
 
     type: str = field(init=False, default="Artifact")
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class DictionaryEntry(SpdxObject):
     """https://spdx.github.io/spdx-spec/v3.0.1/model/Core/Classes/DictionaryEntry/"""
 
@@ -2,7 +2,7 @@
 # Copyright (C) 2025 TNG Technology Consulting GmbH
 
 import json
-from typing import Any
+from typing import Any, Iterable, Iterator
 from sbom.path_utils import PathStr
 from sbom.spdx.core import SPDX_SPEC_VERSION, SpdxDocument, SpdxObject
 
@@ -10,15 +10,16 @@ from sbom.spdx.core import SPDX_SPEC_VERSION, SpdxDocument, SpdxObject
 class JsonLdSpdxDocument:
     """Represents an SPDX document in JSON-LD format for serialization."""
 
-    graph: list[SpdxObject]
+    graph: Iterable[SpdxObject]
 
-    def __init__(self, graph: list[SpdxObject]) -> None:
+    def __init__(self, graph: Iterable[SpdxObject]) -> None:
         """
         Initialize a JSON-LD SPDX document from a graph of SPDX objects.
         The graph must contain a single SpdxDocument element.
 
         Args:
-            graph: List of SPDX objects representing the complete SPDX document.
+            graph: Re-iterable collection of SPDX objects representing the complete SPDX document,
+                e.g., a list or an SpdxGraph.
         """
         self.graph = graph
 
@@ -37,11 +38,6 @@ class JsonLdSpdxDocument:
         Returns:
             Dictionary with @context and @graph keys following JSON-LD format.
         """
-        def _item_to_dict(item: SpdxObject) -> dict:
-            d = item.to_dict()
-            if isinstance(item, SpdxDocument):
-                d.pop("namespaceMap", None)
-            return d
         return {
             "@context": self.context,
             "@graph": [_item_to_dict(item) for item in self.graph],
@@ -50,13 +46,40 @@ class JsonLdSpdxDocument:
     def save(self, path: PathStr, prettify: bool) -> None:
         """
         Save the SPDX document to a JSON file.
+        The output is identical to dumping `to_dict()`, but the graph is serialized one item at a time,
+        so the dictionary representation of the whole graph never has to be held in memory.
 
         Args:
             path: File path where the document will be saved.
             prettify: Whether to pretty-print the JSON with indentation.
         """
         with open(path, "w", encoding="utf-8") as f:
-            if prettify:
-                json.dump(self.to_dict(), f, indent=2)
-            else:
-                json.dump(self.to_dict(), f, separators=(",", ":"))
+            f.writelines(self._iter_json(prettify))
+
+    def _iter_json(self, prettify: bool) -> Iterator[str]:
+        if not prettify:
+            yield '{"@context":'
+            yield json.dumps(self.context, separators=(",", ":"))
+            yield ',"@graph":['
+            for i, item in enumerate(self.graph):
+                if i > 0:
+                    yield ","
+                yield json.dumps(_item_to_dict(item), separators=(",", ":"))
+            yield "]}"
+            return
+
+        # nested values are indented by two spaces per level, like json.dump(..., indent=2)
+        yield '{\n  "@context": '
+        yield json.dumps(self.context, indent=2).replace("\n", "\n  ")
+        yield ',\n  "@graph": ['
+        for i, item in enumerate(self.graph):
+            yield ",\n    " if i > 0 else "\n    "
+            yield json.dumps(_item_to_dict(item), indent=2).replace("\n", "\n    ")
+        yield "\n  ]\n}"
+
+
+def _item_to_dict(item: SpdxObject) -> dict[str, Any]:
+    d = item.to_dict()
+    if isinstance(item, SpdxDocument):
+        d.pop("namespaceMap", None)
+    return d
@@ -5,14 +5,14 @@ from dataclasses import dataclass, field
 from sbom.spdx.core import Element
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class AnyLicenseInfo(Element):
     """https://spdx.github.io/spdx-spec/v3.0.1/model/SimpleLicensing/Classes/AnyLicenseInfo/"""
 
     type: str = field(init=False, default="simplelicensing_AnyLicenseInfo")
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class LicenseExpression(AnyLicenseInfo):
     """https://spdx.github.io/spdx-spec/v3.0.1/model/SimpleLicensing/Classes/LicenseExpression/"""
 
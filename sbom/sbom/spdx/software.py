@@ -2,7 +2,7 @@
 # Copyright (C) 2025 TNG Technology Consulting GmbH
 
 from dataclasses import dataclass, field
-from typing import Literal
+from typing import Literal, Sequence
 from sbom.spdx.core import Artifact, ElementCollection, IntegrityMethod
 
 
@@ -24,15 +24,15 @@ SoftwarePurpose = Literal[
 ContentIdentifierType = Literal["gitoid", "swhid"]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Sbom(ElementCollection):
     """https://spdx.github.io/spdx-spec/v3.0.1/model/Software/Classes/Sbom/"""
 
     type: str = field(init=False, default="software_Sbom")
-    software_sbomType: list[SbomType] = field(default_factory=list)
+    software_sbomType: Sequence[SbomType] = ()
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ContentIdentifier(IntegrityMethod):
     """https://spdx.github.io/spdx-spec/v3.0.1/model/Software/Classes/ContentIdentifier/"""
 
@@ -41,7 +41,7 @@ class ContentIdentifier(IntegrityMethod):
     software_contentIdentifierValue: str
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SoftwareArtifact(Artifact):
     """https://spdx.github.io/spdx-spec/v3.0.1/model/Software/Classes/SoftwareArtifact/"""
 
@@ -51,7 +51,7 @@ class SoftwareArtifact(Artifact):
     software_contentIdentifier: list[ContentIdentifier] = field(default_factory=list)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Package(SoftwareArtifact):
     """https://spdx.github.io/spdx-spec/v3.0.1/model/Software/Classes/Package/"""
 
@@ -60,7 +60,7 @@ class Package(SoftwareArtifact):
     software_packageVersion: str | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class File(SoftwareArtifact):
     """https://spdx.github.io/spdx-spec/v3.0.1/model/Software/Classes/File/"""
 
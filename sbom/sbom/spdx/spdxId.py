@@ -1,7 +1,7 @@
 # SPDX-License-Identifier: GPL-2.0-only OR MIT
 # Copyright (C) 2025 TNG Technology Consulting GmbH
 
-from itertools import count
+from itertools import count, islice
 from typing import Iterator
 
 SpdxId = str
@@ -10,6 +10,7 @@ SpdxId = str
 class SpdxIdGenerator:
     _namespace: str
     _prefix: str | None = None
+    _id_base: str
     _counter: Iterator[int]
 
     def __init__(self, namespace: str, prefix: str | None = None) -> None:
@@ -22,10 +23,24 @@ class SpdxIdGenerator:
         """
         self._namespace = namespace
         self._prefix = prefix
+        self._id_base = f"{prefix}:" if prefix else namespace
         self._counter = count(0)
 
     def generate(self) -> SpdxId:
-        return f"{f'{self._prefix}:' if self._prefix else self._namespace}{next(self._counter)}"
+        return f"{self._id_base}{next(self._counter)}"
+
+    def generate_many(self, n: int) -> list[SpdxId]:
+        """
+        Generate n consecutive SPDX IDs, equivalent to calling generate() n times.
+
+        Args:
+            n: Number of IDs to generate.
+
+        Returns:
+            list[SpdxId]: The generated IDs in order.
+        """
+        id_base = self._id_base
+        return [f"{id_base}{i}" for i in islice(self._counter, n)]
 
     @property
     def prefix(self) -> str | None:
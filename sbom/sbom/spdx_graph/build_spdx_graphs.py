@@ -5,10 +5,10 @@ from datetime import datetime
 from typing import Protocol
 
 import logging
-from sbom.config import KernelSpdxDocumentKind
-from sbom.cmd_graph import CmdGraph
+from sbom.config import FileHash, KernelSpdxDocumentKind
+from sbom.cmd_graph import CmdGraph, CmdGraphNode
 from sbom.path_utils import PathStr
-from sbom.spdx_graph.kernel_file import KernelFileCollection
+from sbom.spdx_graph.kernel_file import KernelFileCollection, clear_file_caches
 from sbom.spdx_graph.spdx_graph_model import SpdxGraph, SpdxIdGeneratorCollection
 from sbom.spdx_graph.shared_spdx_elements import SharedSpdxElements
 from sbom.spdx_graph.spdx_source_graph import SpdxSourceGraph
@@ -25,10 +25,12 @@ class SpdxGraphConfig(Protocol):
     package_license: str
     package_version: str | None
     package_copyright_text: str | None
+    file_hashes: list[FileHash]
 
 
 def build_spdx_graphs(
     cmd_graph: CmdGraph,
+    cmd_graph_nodes: list[CmdGraphNode],
     spdx_id_generators: SpdxIdGeneratorCollection,
     config: SpdxGraphConfig,
 ) -> dict[KernelSpdxDocumentKind, SpdxGraph]:
@@ -39,16 +41,20 @@ def build_spdx_graphs(
 
     Args:
         cmd_graph: The dependency graph of a kernel build.
+        cmd_graph_nodes: Unique nodes of `cmd_graph` in breadth-first order, as yielded by iterating the graph.
         spdx_id_generators: Collection of SPDX ID generators.
         config: Configuration options.
 
     Returns:
         Dictionary of SPDX graphs
     """
+    clear_file_caches()
     shared_elements = SharedSpdxElements.create(spdx_id_generators.base, config.created)
-    kernel_files = KernelFileCollection.create(cmd_graph, config.obj_tree, config.src_tree, spdx_id_generators)
+    kernel_files = KernelFileCollection.create(
+        cmd_graph, cmd_graph_nodes, config.obj_tree, config.src_tree, spdx_id_generators, config.file_hashes
+    )
     output_graph = SpdxOutputGraph.create(
-        root_files=list(kernel_files.output.values()),
+        root_files=kernel_files.output.values(),
         shared_elements=shared_elements,
         spdx_id_generators=spdx_id_generators,
         config=config,
@@ -72,7 +78,7 @@ def build_spdx_graphs(
         )
 
     build_graph = SpdxBuildGraph.create(
-        cmd_graph,
+        cmd_graph_nodes,
         kernel_files,
         shared_elements,
         output_graph.high_level_build_element,
@@ -1,13 +1,21 @@
 # SPDX-License-Identifier: GPL-2.0-only OR MIT
 # Copyright (C) 2025 TNG Technology Consulting GmbH
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 import hashlib
+import logging
+from itertools import repeat
 import os
 import re
-from sbom.cmd_graph import CmdGraph
-from sbom.path_utils import PathStr, is_relative_to
+import stat
+import sys
+from typing import Collection, Iterable, Iterator
+from sbom.cmd_graph import CmdGraph, CmdGraphNode
+from sbom.config import ALL_FILE_HASHES, FileHash
+from sbom.path_utils import PathStr, cached_stat, tree_relative_path
 from sbom.spdx import SpdxId, SpdxIdGenerator
 from sbom.spdx.core import Hash
 from sbom.spdx.software import ContentIdentifier, File, SoftwarePurpose
@@ -28,7 +36,7 @@ class KernelFileLocation(Enum):
     """File is located in a folder that is both source and object tree."""
 
 
-@dataclass
+@dataclass(slots=True)
 class KernelFile:
     """kernel-specific metadata used to generate an SPDX File element."""
 
@@ -45,6 +53,8 @@ class KernelFile:
     """SPDX license ID if file_location equals SOURCE_TREE or BOTH; otherwise None."""
     spdx_id_generator: SpdxIdGenerator
     """Generator for the SPDX ID of the file element."""
+    file_hashes: Collection[FileHash]
+    """Digests to compute for the file element."""
 
     _spdx_file_element: File | None = None
 
@@ -56,34 +66,15 @@ class KernelFile:
         src_tree: PathStr,
         spdx_id_generators: SpdxIdGeneratorCollection,
         is_output: bool,
+        file_hashes: Collection[FileHash] = ALL_FILE_HASHES,
     ) -> "KernelFile":
-        is_in_obj_tree = is_relative_to(absolute_path, obj_tree)
-        is_in_src_tree = is_relative_to(absolute_path, src_tree)
-
-        # file element name should be relative to output or src tree if possible
-        if not is_in_src_tree and not is_in_obj_tree:
-            file_element_name = str(absolute_path)
-            file_location = KernelFileLocation.EXTERNAL
+        file_location, file_element_name, license_identifier = _file_metadata(absolute_path, obj_tree, src_tree)
+        if file_location == KernelFileLocation.EXTERNAL:
             spdx_id_generator = spdx_id_generators.source if src_tree != obj_tree else spdx_id_generators.build
-        elif is_in_src_tree and src_tree == obj_tree:
-            file_element_name = os.path.relpath(absolute_path, obj_tree)
-            file_location = KernelFileLocation.BOTH
-            spdx_id_generator = spdx_id_generators.output if is_output else spdx_id_generators.build
-        elif is_in_obj_tree:
-            file_element_name = os.path.relpath(absolute_path, obj_tree)
-            file_location = KernelFileLocation.OBJ_TREE
-            spdx_id_generator = spdx_id_generators.output if is_output else spdx_id_generators.build
-        else:
-            file_element_name = os.path.relpath(absolute_path, src_tree)
-            file_location = KernelFileLocation.SOURCE_TREE
+        elif file_location == KernelFileLocation.SOURCE_TREE:
             spdx_id_generator = spdx_id_generators.source
-
-        # parse spdx license identifier
-        license_identifier = (
-            _parse_spdx_license_identifier(absolute_path)
-            if file_location == KernelFileLocation.SOURCE_TREE or file_location == KernelFileLocation.BOTH
-            else None
-        )
+        else:
+            spdx_id_generator = spdx_id_generators.output if is_output else spdx_id_generators.build
 
         return KernelFile(
             absolute_path,
@@ -91,6 +82,7 @@ class KernelFile:
             file_element_name,
             license_identifier,
             spdx_id_generator,
+            file_hashes,
         )
 
     @property
@@ -101,6 +93,7 @@ class KernelFile:
                 self.name,
                 self.spdx_id_generator.generate(),
                 self.file_location,
+                self.file_hashes,
             )
         return self._spdx_file_element
 
@@ -118,16 +111,21 @@ class KernelFileCollection:
     def create(
         cls,
         cmd_graph: CmdGraph,
+        cmd_graph_nodes: list[CmdGraphNode],
         obj_tree: PathStr,
         src_tree: PathStr,
         spdx_id_generators: SpdxIdGeneratorCollection,
+        file_hashes: Collection[FileHash] = ALL_FILE_HASHES,
     ) -> "KernelFileCollection":
         source: dict[PathStr, KernelFile] = {}
         build: dict[PathStr, KernelFile] = {}
         output: dict[PathStr, KernelFile] = {}
         external: dict[PathStr, KernelFile] = {}
+        node_paths = [node.absolute_path for node in cmd_graph_nodes]
+        prefetch_file_metadata(node_paths, obj_tree, src_tree)
+        prehash_files(node_paths, file_hashes)
         root_node_paths = {node.absolute_path for node in cmd_graph.roots}
-        for node in cmd_graph:
+        for node in cmd_graph_nodes:
             is_root = node.absolute_path in root_node_paths
             kernel_file = KernelFile.create(
                 node.absolute_path,
@@ -135,33 +133,129 @@ class KernelFileCollection:
                 src_tree,
                 spdx_id_generators,
                 is_root,
+                file_hashes,
             )
             if is_root:
                 output[kernel_file.absolute_path] = kernel_file
-            elif kernel_file.file_location == KernelFileLocation.SOURCE_TREE:
+            elif kernel_file.file_location is KernelFileLocation.SOURCE_TREE:
                 source[kernel_file.absolute_path] = kernel_file
-            elif kernel_file.file_location == KernelFileLocation.EXTERNAL:
+            elif kernel_file.file_location is KernelFileLocation.EXTERNAL:
                 external[kernel_file.absolute_path] = kernel_file
             else:
                 build[kernel_file.absolute_path] = kernel_file
 
         return KernelFileCollection(source, build, output, external)
 
-    def to_dict(self) -> dict[PathStr, KernelFile]:
-        return {**self.source, **self.build, **self.output, **self.external}
+
+@lru_cache(maxsize=None)
+def _file_metadata(
+    absolute_path: PathStr, obj_tree: PathStr, src_tree: PathStr
+) -> tuple[KernelFileLocation, str, str | None]:
+    """
+    Determines the ID-independent metadata of a kernel file. The result is memoized so that a path
+    visited more than once within a run is only classified and scanned for its license once.
+    The cache is cleared by `clear_file_caches` at the start of each run.
+
+    Args:
+        absolute_path: Normalized absolute path of the file.
+        obj_tree: Absolute path to the object tree.
+        src_tree: Absolute path to the source tree.
+
+    Returns:
+        Tuple of (file location, file element name, SPDX license identifier).
+    """
+    # file element name should be relative to output or src tree if possible
+    file_location, file_element_name = _classify_path(absolute_path, obj_tree, src_tree)
+
+    # parse spdx license identifier
+    license_identifier = (
+        _parse_spdx_license_identifier(absolute_path)
+        if file_location == KernelFileLocation.SOURCE_TREE or file_location == KernelFileLocation.BOTH
+        else None
+    )
+    return file_location, file_element_name, license_identifier
+
+
+PARALLEL_METADATA_MIN_FILES = 2000
+"""Minimum number of files for which file metadata is collected by a thread pool."""
 
 
-def _build_file_element(absolute_path: PathStr, name: str, spdx_id: SpdxId, file_location: KernelFileLocation) -> File:
+def prefetch_file_metadata(
+    file_paths: Collection[PathStr],
+    obj_tree: PathStr,
+    src_tree: PathStr,
+    min_files: int | None = None,
+    max_workers: int | None = None,
+) -> None:
+    """
+    Stats the given files and scans them for license identifiers in a thread pool, filling the
+    `cached_stat` and `_file_metadata` caches before the kernel files are created sequentially.
+    Both steps mostly wait on the filesystem and release the GIL while doing so, which lets
+    threads overlap their latency on a cold page cache.
+
+    Args:
+        file_paths: Absolute paths of the files that will become kernel files.
+        obj_tree: Absolute path to the object tree.
+        src_tree: Absolute path to the source tree.
+        min_files: Minimum number of files for which a thread pool is used. Defaults to PARALLEL_METADATA_MIN_FILES.
+        max_workers: Maximum number of worker threads. Defaults to the ThreadPoolExecutor default.
+    """
+    if min_files is None:
+        min_files = PARALLEL_METADATA_MIN_FILES
+    if len(file_paths) < min_files:
+        return
+
+    def prefetch(file_path: PathStr) -> None:
+        cached_stat(file_path)
+        _file_metadata(file_path, obj_tree, src_tree)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for _ in executor.map(prefetch, file_paths):
+            pass
+
+
+def _classify_path(absolute_path: PathStr, obj_tree: PathStr, src_tree: PathStr) -> tuple[KernelFileLocation, str]:
+    """
+    Determines the location of a file relative to the source/object trees together with its file element name.
+
+    Args:
+        absolute_path: Normalized absolute path of the file.
+        obj_tree: Absolute path to the object tree.
+        src_tree: Absolute path to the source tree.
+
+    Returns:
+        Tuple of (file location, file element name).
+    """
+    obj_tree_name = tree_relative_path(absolute_path, obj_tree)
+    if obj_tree_name is not None:
+        return (KernelFileLocation.BOTH if src_tree == obj_tree else KernelFileLocation.OBJ_TREE), obj_tree_name
+    src_tree_name = tree_relative_path(absolute_path, src_tree) if src_tree != obj_tree else None
+    if src_tree_name is not None:
+        return KernelFileLocation.SOURCE_TREE, src_tree_name
+    return KernelFileLocation.EXTERNAL, str(absolute_path)
+
+
+def _build_file_element(
+    absolute_path: PathStr,
+    name: str,
+    spdx_id: SpdxId,
+    file_location: KernelFileLocation,
+    file_hashes: Collection[FileHash],
+) -> File:
     verifiedUsing: list[Hash] = []
     content_identifier: list[ContentIdentifier] = []
-    if os.path.isfile(absolute_path):
-        verifiedUsing = [Hash(algorithm="sha256", hashValue=_sha256(absolute_path))]
-        content_identifier = [
-            ContentIdentifier(
-                software_contentIdentifierType="gitoid",
-                software_contentIdentifierValue=_git_blob_oid(absolute_path),
-            )
-        ]
+    file_stat = cached_stat(absolute_path)
+    if file_stat is not None and stat.S_ISREG(file_stat.st_mode):
+        digests = _hash_file_deduplicated(absolute_path, file_stat, file_hashes)
+        if "sha256" in digests:
+            verifiedUsing = [Hash(algorithm="sha256", hashValue=digests["sha256"])]
+        if "gitoid" in digests:
+            content_identifier = [
+                ContentIdentifier(
+                    software_contentIdentifierType="gitoid",
+                    software_contentIdentifierValue=digests["gitoid"],
+                )
+            ]
     elif file_location == KernelFileLocation.EXTERNAL:
         sbom_logging.warning(
             "Cannot compute hash for {absolute_path} because file does not exist.",
@@ -185,32 +279,133 @@ def _build_file_element(absolute_path: PathStr, name: str, spdx_id: SpdxId, file
     )
 
 
-def _sha256(file_path: PathStr, chunk_size: int = 1 << 20) -> str:
-    """Compute the SHA-256 hex digest of a file, reading it in chunks of chunk_size bytes."""
-    h = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(chunk_size), b""):
-            h.update(chunk)
-    return h.hexdigest()
+def _hash_file(
+    file_path: PathStr, file_size: int, file_hashes: Collection[FileHash], chunk_size: int = 1 << 20
+) -> dict[FileHash, str]:
+    """
+    Compute the requested digests of a file in a single pass, reading it in chunks of chunk_size bytes.
+    'sha256' is the SHA-256 hex digest of the content and 'gitoid' the Git blob object ID (SHA-1 hex)
+    of a file of file_size bytes, like `git hash-object`.
+    """
+    hashers: dict[FileHash, "hashlib._Hash"] = {}
+    if "sha256" in file_hashes:
+        hashers["sha256"] = hashlib.sha256()
+    if "gitoid" in file_hashes:
+        hashers["gitoid"] = hashlib.sha1(b"blob %d\0" % file_size)
+    if hashers and file_size > 0:
+        for chunk in _read_chunks(file_path, chunk_size):
+            for h in hashers.values():
+                h.update(chunk)
+    return {name: h.hexdigest() for name, h in hashers.items()}
+
+
+_FileIdentity = tuple[int, int, int, int, frozenset[FileHash]]
+_file_digest_cache: dict[_FileIdentity, dict[FileHash, str]] = {}
+"""Digests of already hashed files keyed by device, inode, size, modification time and requested digests."""
+
+
+def _hash_file_deduplicated(
+    file_path: PathStr, file_stat: os.stat_result, file_hashes: Collection[FileHash]
+) -> dict[FileHash, str]:
+    """
+    Like `_hash_file`, but content reachable through multiple paths (hard links, bind mounts,
+    or files referenced by several graphs) is only read and hashed once.
+    """
+    key = (file_stat.st_dev, file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns, frozenset(file_hashes))
+    digests = _file_digest_cache.get(key)
+    if digests is None:
+        digests = _file_digest_cache[key] = _hash_file(file_path, file_stat.st_size, file_hashes)
+    return digests
+
+
+def clear_file_caches() -> None:
+    """
+    Clears the cached file metadata and digests of previous runs, so that neither digests nor license
+    identifiers are derived from a file that has changed since. Must be called before the kernel files
+    of a new run are created. Stat results are cleared once per run by `CmdGraph.create` instead, so
+    that they are shared between building the cmd graph and hashing the files.
+    """
+    _file_metadata.cache_clear()
+    _file_digest_cache.clear()
+
+
+PARALLEL_HASHING_MIN_FILES = 2000
+"""Minimum number of files still to be hashed for which hashing is distributed across worker processes."""
 
 
-def _git_blob_oid(file_path: str, chunk_size: int = 1 << 20) -> str:
-    """Compute the Git blob object ID (SHA-1 hex) for a file, like `git hash-object`, reading it in chunks of chunk_size bytes."""
-    h = hashlib.sha1()
-    h.update(f"blob {os.path.getsize(file_path)}\0".encode())
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(chunk_size), b""):
-            h.update(chunk)
-    return h.hexdigest()
+def prehash_files(
+    file_paths: Iterable[PathStr],
+    file_hashes: Collection[FileHash],
+    min_files: int | None = None,
+    max_workers: int | None = None,
+) -> None:
+    """
+    Hashes the given regular files in a process pool and stores the digests in the digest cache,
+    so that building the file elements afterwards does not read any of them again.
+    Below min_files distinct files the pool startup outweighs the gain and nothing is done.
+    Nothing is done either if no process pool can be created on this host, e.g. in sandboxes
+    without working semaphores, in which case the files are hashed sequentially later on.
+
+    Args:
+        file_paths: Absolute paths of the files that will be hashed.
+        file_hashes: Digests to compute for each file.
+        min_files: Minimum number of files not yet hashed for which a process pool is used.
+            Defaults to PARALLEL_HASHING_MIN_FILES.
+        max_workers: Maximum number of worker processes. Defaults to the number of CPUs.
+    """
+    requested_hashes = frozenset(file_hashes)
+    if not requested_hashes:
+        return
+    pending: dict[_FileIdentity, tuple[PathStr, int]] = {}
+    for file_path in file_paths:
+        file_stat = cached_stat(file_path)
+        if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
+            continue
+        key = (file_stat.st_dev, file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns, requested_hashes)
+        if key not in _file_digest_cache and key not in pending:
+            pending[key] = (file_path, file_stat.st_size)
+    if min_files is None:
+        min_files = PARALLEL_HASHING_MIN_FILES
+    if not pending or len(pending) < min_files:
+        return
+
+    try:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+    except (NotImplementedError, OSError) as e:
+        logging.debug(f"Skipped parallel hashing because no process pool could be created: {e}")
+        return
+    with executor:
+        all_digests = executor.map(
+            _hash_file,
+            [file_path for file_path, _ in pending.values()],
+            [file_size for _, file_size in pending.values()],
+            repeat(requested_hashes),
+            chunksize=64,
+        )
+        for key, digests in zip(pending, all_digests):
+            _file_digest_cache[key] = digests
+
+
+def _read_chunks(file_path: PathStr, chunk_size: int) -> Iterator[bytes]:
+    """
+    Yields the content of a file in chunks of up to chunk_size bytes.
+    The file is opened unbuffered because chunks are already large, and the kernel is advised
+    about the sequential access pattern where supported to enable aggressive read-ahead.
+    """
+    with open(file_path, "rb", buffering=0) as f:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        yield from iter(lambda: f.read(chunk_size), b"")
 
 
 # REUSE-IgnoreStart
+SPDX_LICENSE_IDENTIFIER_TAG = b"SPDX-License-Identifier:"
 SPDX_LICENSE_IDENTIFIER_PATTERN = re.compile(
-    r"SPDX-License-Identifier:"   # literal tag
-    r"\s*"                        # optional whitespace after colon
-    r"(?P<id>.*?)"                # license expression (non-greedy, stops before terminator)
-    r"(?:\s*"                     # optional whitespace before terminator (not captured)
-    r"(-->|\*/|$))",              # terminator: XML "-->", C-style "*/", or end of line
+    rb"SPDX-License-Identifier:"  # literal tag
+    rb"\s*"                       # optional whitespace after colon
+    rb"(?P<id>.*?)"               # license expression (non-greedy, stops before terminator)
+    rb"(?:\s*"                    # optional whitespace before terminator (not captured)
+    rb"(-->|\*/|$))",             # terminator: XML "-->", C-style "*/", or end of line
     re.MULTILINE,                 # match end of each line, not just end of string
 )
 # REUSE-IgnoreEnd
@@ -219,6 +414,8 @@ SPDX_LICENSE_IDENTIFIER_PATTERN = re.compile(
 def _parse_spdx_license_identifier(absolute_path: str, max_bytes: int = 512) -> str | None:
     """
     Extracts the SPDX-License-Identifier from the beginning of a source file.
+    The raw bytes are prescanned for the literal tag so the regex only runs on files containing it,
+    and only the matched license expression is decoded.
 
     Args:
         absolute_path: Path to the source file.
@@ -228,49 +425,37 @@ def _parse_spdx_license_identifier(absolute_path: str, max_bytes: int = 512) ->
         The license identifier string (e.g., 'GPL-2.0-only') if found, otherwise None.
     """
     try:
-        with open(absolute_path, "r", encoding="utf-8") as f:
-            match = SPDX_LICENSE_IDENTIFIER_PATTERN.search(f.read(max_bytes))
-            if match:
-                return match.group("id")
+        with open(absolute_path, "rb") as f:
+            head = f.read(max_bytes)
+        tag_index = head.find(SPDX_LICENSE_IDENTIFIER_TAG)
+        if tag_index < 0:
+            return None
+        match = SPDX_LICENSE_IDENTIFIER_PATTERN.match(head, tag_index)
+        if match:
+            # Only a handful of distinct license expressions exist across all kernel files
+            return sys.intern(match.group("id").decode("utf-8"))
     except (UnicodeDecodeError, OSError):
         return None
     return None
 
 
-def _get_primary_purpose(absolute_path: PathStr) -> SoftwarePurpose | None:
-    def ends_with(suffixes: list[str]) -> bool:
-        return any(absolute_path.endswith(suffix) for suffix in suffixes)
-
-    def includes_path_segments(path_segments: list[str]) -> bool:
-        return any(segment in absolute_path for segment in path_segments)
-
+PRIMARY_PURPOSE_RULES: list[tuple[SoftwarePurpose, tuple[str, ...], tuple[str, ...]]] = [
     # Source code
-    if ends_with([".c", ".h", ".S", ".s", ".rs", ".pl", "gen_smb1_mapping", "gen_smb2_mapping"]):
-        return "source"
-
+    ("source", (".c", ".h", ".S", ".s", ".rs", ".pl", "gen_smb1_mapping", "gen_smb2_mapping"), ()),
     # Libraries
-    if ends_with([".a", ".so", ".so.raw", ".rlib"]):
-        return "library"
-
+    ("library", (".a", ".so", ".so.raw", ".rlib"), ()),
     # Archives
-    if ends_with([".xz", ".cpio", ".gz", ".tar", ".zip", "piggy_data"]):
-        return "archive"
-
+    ("archive", (".xz", ".cpio", ".gz", ".tar", ".zip", "piggy_data"), ()),
     # Applications
-    if ends_with(["bzImage", "Image", ".efi"]):
-        return "application"
-
+    ("application", ("bzImage", "Image", ".efi"), ()),
     # Executables / machine code
-    if ends_with([".bin", ".elf", "vmlinux", "vmlinux.unstripped", "vmlinuz", "bpfilter_umh"]):
-        return "executable"
-
+    ("executable", (".bin", ".elf", "vmlinux", "vmlinux.unstripped", "vmlinuz", "bpfilter_umh"), ()),
     # Kernel modules
-    if ends_with([".ko"]):
-        return "module"
-
+    ("module", (".ko",), ()),
     # Data files
-    if ends_with(
-        [
+    (
+        "data",
+        (
             ".tbl",
             ".relocs",
             ".rmeta",
@@ -296,20 +481,72 @@ def _get_primary_purpose(absolute_path: PathStr) -> SoftwarePurpose | None:
             "cpucaps",
             "sysreg",
             "mach-types",
-        ]
-    ) or includes_path_segments(["drivers/gpu/drm/radeon/reg_srcs/"]):
-        return "data"
-
+        ),
+        ("drivers/gpu/drm/radeon/reg_srcs/",),
+    ),
     # Configuration files
-    if ends_with([".pem", ".key", ".conf", ".config", ".cfg", ".bconf"]):
-        return "configuration"
-
+    ("configuration", (".pem", ".key", ".conf", ".config", ".cfg", ".bconf"), ()),
     # Documentation
-    if ends_with([".md"]):
-        return "documentation"
-
+    ("documentation", (".md",), ()),
     # Other / miscellaneous
-    if ends_with([".o", ".tmp"]):
-        return "other"
+    ("other", (".o", ".tmp"), ()),
+]
+"""
+Ordered (purpose, path suffixes, path segments) rules used to infer the primary purpose of a file.
+The first rule whose suffixes match the end of the path or whose segments occur within the path wins.
+"""
+
+
+def _match_primary_purpose_rules(path: str) -> SoftwarePurpose | None:
+    for purpose, suffixes, path_segments in PRIMARY_PURPOSE_RULES:
+        if path.endswith(suffixes) or any(segment in path for segment in path_segments):
+            return purpose
+    return None
+
 
-    sbom_logging.warning("Could not infer primary purpose for {absolute_path}", absolute_path=absolute_path)
+def _build_primary_purpose_lookups() -> tuple[dict[str, SoftwarePurpose], dict[str, SoftwarePurpose]]:
+    """
+    Precomputes exact lookup tables equivalent to `PRIMARY_PURPOSE_RULES` for paths outside any rule's path segments.
+    Rule suffixes never contain a path separator, so the matching rule only depends on the file basename.
+
+    Returns:
+        Tuple of (basename -> purpose, extension -> purpose). Extensions which are the tail of a longer
+        rule suffix (e.g., '.raw' of '.so.raw') are omitted since their purpose depends on more context.
+    """
+    all_suffixes = [suffix for _, suffixes, _ in PRIMARY_PURPOSE_RULES for suffix in suffixes]
+    basename_purposes: dict[str, SoftwarePurpose] = {}
+    extension_purposes: dict[str, SoftwarePurpose] = {}
+    for suffix in all_suffixes:
+        if "." not in suffix:
+            purpose = _match_primary_purpose_rules(os.sep + suffix)
+            if purpose is not None:
+                basename_purposes.setdefault(suffix, purpose)
+        elif suffix.rfind(".") == 0 and not any(
+            len(other) > len(suffix) and other.endswith(suffix) for other in all_suffixes
+        ):
+            purpose = _match_primary_purpose_rules(suffix)
+            if purpose is not None:
+                extension_purposes.setdefault(suffix, purpose)
+    return basename_purposes, extension_purposes
+
+
+_BASENAME_PURPOSES, _EXTENSION_PURPOSES = _build_primary_purpose_lookups()
+_PRIMARY_PURPOSE_PATH_SEGMENTS = tuple(segment for _, _, path_segments in PRIMARY_PURPOSE_RULES for segment in path_segments)
+
+
+def _get_primary_purpose(absolute_path: PathStr) -> SoftwarePurpose | None:
+    # Fast path: O(1) lookup by basename or extension
+    if not any(segment in absolute_path for segment in _PRIMARY_PURPOSE_PATH_SEGMENTS):
+        basename = os.path.basename(absolute_path)
+        purpose = _BASENAME_PURPOSES.get(basename)
+        if purpose is None:
+            _, dot, extension = basename.rpartition(".")
+            purpose = _EXTENSION_PURPOSES.get(dot + extension) if dot else None
+        if purpose is not None:
+            return purpose
+
+    # Slow path: ordered rule matching, e.g., for suffixes which are not a full extension or basename
+    purpose = _match_primary_purpose_rules(absolute_path)
+    if purpose is None:
+        sbom_logging.warning("Could not infer primary purpose for {absolute_path}", absolute_path=absolute_path)
+    return purpose
@@ -2,12 +2,13 @@
 # Copyright (C) 2025 TNG Technology Consulting GmbH
 
 from dataclasses import dataclass
+from itertools import chain
 from typing import Mapping
-from sbom.cmd_graph import CmdGraph
+from sbom.cmd_graph import CmdGraphNode
 from sbom.path_utils import PathStr
 from sbom.spdx import SpdxIdGenerator
 from sbom.spdx.build import Build
-from sbom.spdx.core import ExternalMap, NamespaceMap, Relationship, SpdxDocument
+from sbom.spdx.core import Element, ExternalMap, NamespaceMap, Relationship, SpdxDocument
 from sbom.spdx.software import File, Sbom
 from sbom.spdx_graph.kernel_file import KernelFileCollection
 from sbom.spdx_graph.shared_spdx_elements import SharedSpdxElements
@@ -15,7 +16,7 @@ from sbom.spdx_graph.spdx_graph_model import SpdxGraph, SpdxIdGeneratorCollectio
 from sbom.spdx_graph.spdx_source_graph import source_file_license_elements
 
 
-@dataclass
+@dataclass(slots=True)
 class SpdxBuildGraph(SpdxGraph):
     """SPDX graph representing build dependencies connecting source files and
     distributable output files"""
@@ -23,7 +24,7 @@ class SpdxBuildGraph(SpdxGraph):
     @classmethod
     def create(
         cls,
-        cmd_graph: CmdGraph,
+        cmd_graph_nodes: list[CmdGraphNode],
         kernel_files: KernelFileCollection,
         shared_elements: SharedSpdxElements,
         high_level_build_element: Build,
@@ -31,7 +32,7 @@ class SpdxBuildGraph(SpdxGraph):
     ) -> "SpdxBuildGraph":
         if len(kernel_files.source) > 0:
             return _create_spdx_build_graph(
-                cmd_graph,
+                cmd_graph_nodes,
                 kernel_files,
                 shared_elements,
                 high_level_build_element,
@@ -39,7 +40,7 @@ class SpdxBuildGraph(SpdxGraph):
             )
         else:
             return _create_spdx_build_graph_with_mixed_sources(
-                cmd_graph,
+                cmd_graph_nodes,
                 kernel_files,
                 shared_elements,
                 high_level_build_element,
@@ -48,7 +49,7 @@ class SpdxBuildGraph(SpdxGraph):
 
 
 def _create_spdx_build_graph(
-    cmd_graph: CmdGraph,
+    cmd_graph_nodes: list[CmdGraphNode],
     kernel_files: KernelFileCollection,
     shared_elements: SharedSpdxElements,
     high_level_build_element: Build,
@@ -59,7 +60,7 @@ def _create_spdx_build_graph(
     from external documents.
 
     Args:
-        cmd_graph: The dependency graph of a kernel build.
+        cmd_graph_nodes: Unique nodes of the dependency graph of a kernel build in breadth-first order.
         kernel_files: Collection of categorized kernel files involved in the build.
         shared_elements: SPDX elements shared across multiple documents.
         high_level_build_element: The high-level Build element referenced by the build graph.
@@ -68,27 +69,8 @@ def _create_spdx_build_graph(
     Returns:
         SpdxBuildGraph: The SPDX build graph connecting source files and distributable output files.
     """
-    # SpdxDocument
-    build_spdx_document = SpdxDocument(
-        spdxId=spdx_id_generators.build.generate(),
-        profileConformance=["core", "software", "build"],
-        namespaceMap=[
-            NamespaceMap(prefix=generator.prefix, namespace=generator.namespace)
-            for generator in [
-                spdx_id_generators.build,
-                spdx_id_generators.source,
-                spdx_id_generators.output,
-                spdx_id_generators.base,
-            ]
-            if generator.prefix is not None
-        ],
-    )
-
-    # Sbom
-    build_sbom = Sbom(
-        spdxId=spdx_id_generators.build.generate(),
-        software_sbomType=["build"],
-    )
+    # SpdxDocument and Sbom
+    build_spdx_document, build_sbom = _build_document_elements(spdx_id_generators, include_source=True)
 
     # Src and object tree elements
     obj_tree_element = File(
@@ -104,27 +86,21 @@ def _create_spdx_build_graph(
     )
 
     # File elements
-    build_file_elements = [file.spdx_file_element for file in kernel_files.build.values()]
-    file_relationships = _file_relationships(
-        cmd_graph=cmd_graph,
-        file_elements={key: file.spdx_file_element for key, file in kernel_files.to_dict().items()},
-        high_level_build_element=high_level_build_element,
-        spdx_id_generator=spdx_id_generators.build,
+    build_file_elements, file_relationships = _build_file_elements(
+        cmd_graph_nodes, kernel_files, high_level_build_element, spdx_id_generators.build
     )
 
     # Update relationships
-    build_spdx_document.rootElement = [build_sbom]
-
     build_spdx_document.import_ = [
         *(
             ExternalMap(externalSpdxId=file.spdx_file_element.spdxId)
-            for file in (*kernel_files.source.values(), *kernel_files.external.values())
+            for file in chain(kernel_files.source.values(), kernel_files.external.values())
         ),
         ExternalMap(externalSpdxId=high_level_build_element.spdxId),
         *(ExternalMap(externalSpdxId=file.spdx_file_element.spdxId) for file in kernel_files.output.values()),
     ]
 
-    build_sbom.rootElement = [obj_tree_element]
+    build_sbom.rootElement = (obj_tree_element,)
     build_sbom.element = [
         obj_tree_element,
         obj_tree_contains_relationship,
@@ -148,7 +124,7 @@ def _create_spdx_build_graph(
 
 
 def _create_spdx_build_graph_with_mixed_sources(
-    cmd_graph: CmdGraph,
+    cmd_graph_nodes: list[CmdGraphNode],
     kernel_files: KernelFileCollection,
     shared_elements: SharedSpdxElements,
     high_level_build_element: Build,
@@ -159,7 +135,7 @@ def _create_spdx_build_graph_with_mixed_sources(
     an external document. Source files are included directly in the build graph.
 
     Args:
-        cmd_graph: The dependency graph of a kernel build.
+        cmd_graph_nodes: Unique nodes of the dependency graph of a kernel build in breadth-first order.
         kernel_files: Collection of categorized kernel files involved in the build.
         shared_elements: SPDX elements shared across multiple documents.
         high_level_build_element: The high-level Build element referenced by the build graph.
@@ -168,51 +144,28 @@ def _create_spdx_build_graph_with_mixed_sources(
     Returns:
         SpdxBuildGraph: The SPDX build graph connecting source files and distributable output files.
     """
-    # SpdxDocument
-    build_spdx_document = SpdxDocument(
-        spdxId=spdx_id_generators.build.generate(),
-        profileConformance=["core", "software", "build"],
-        namespaceMap=[
-            NamespaceMap(prefix=generator.prefix, namespace=generator.namespace)
-            for generator in [
-                spdx_id_generators.build,
-                spdx_id_generators.output,
-                spdx_id_generators.base,
-            ]
-            if generator.prefix is not None
-        ],
-    )
-
-    # Sbom
-    build_sbom = Sbom(
-        spdxId=spdx_id_generators.build.generate(),
-        software_sbomType=["build"],
-    )
+    # SpdxDocument and Sbom
+    build_spdx_document, build_sbom = _build_document_elements(spdx_id_generators, include_source=False)
 
     # File elements
-    build_file_elements = [file.spdx_file_element for file in kernel_files.build.values()]
-    external_file_elements = [file.spdx_file_element for file in kernel_files.external.values()]
-    file_relationships = _file_relationships(
-        cmd_graph=cmd_graph,
-        file_elements={key: file.spdx_file_element for key, file in kernel_files.to_dict().items()},
-        high_level_build_element=high_level_build_element,
-        spdx_id_generator=spdx_id_generators.build,
+    build_file_elements, file_relationships = _build_file_elements(
+        cmd_graph_nodes, kernel_files, high_level_build_element, spdx_id_generators.build
     )
+    external_file_elements = [file.spdx_file_element for file in kernel_files.external.values()]
 
     # Source file license elements
     source_file_license_identifiers, source_file_license_relationships = source_file_license_elements(
-        list(kernel_files.build.values()), spdx_id_generators.build
+        kernel_files.build.values(), spdx_id_generators.build
     )
 
     # Update relationships
-    build_spdx_document.rootElement = [build_sbom]
-    root_file_elements = [file.spdx_file_element for file in kernel_files.output.values()]
+    root_file_elements: list[Element] = [file.spdx_file_element for file in kernel_files.output.values()]
     build_spdx_document.import_ = [
         ExternalMap(externalSpdxId=high_level_build_element.spdxId),
         *(ExternalMap(externalSpdxId=file.spdxId) for file in root_file_elements),
     ]
 
-    build_sbom.rootElement = [*root_file_elements]
+    build_sbom.rootElement = root_file_elements
     build_sbom.element = [
         *build_file_elements,
         *external_file_elements,
@@ -230,8 +183,96 @@ def _create_spdx_build_graph_with_mixed_sources(
     return build_graph
 
 
+def _build_document_elements(
+    spdx_id_generators: SpdxIdGeneratorCollection, include_source: bool
+) -> tuple[SpdxDocument, Sbom]:
+    """
+    Creates the SpdxDocument and Sbom elements of the build graph shared by both build graph variants.
+
+    Args:
+        spdx_id_generators: Collection of generators for SPDX element IDs.
+        include_source: Whether source files are referenced from the source document.
+
+    Returns:
+        Tuple of (build SpdxDocument, build Sbom) with the Sbom set as the document's root element.
+    """
+    build_spdx_document = SpdxDocument(
+        spdxId=spdx_id_generators.build.generate(),
+        profileConformance=("core", "software", "build"),
+        namespaceMap=_build_namespace_map(spdx_id_generators, include_source),
+    )
+    build_sbom = Sbom(
+        spdxId=spdx_id_generators.build.generate(),
+        software_sbomType=("build",),
+    )
+    build_spdx_document.rootElement = (build_sbom,)
+    return build_spdx_document, build_sbom
+
+
+def _build_file_elements(
+    cmd_graph_nodes: list[CmdGraphNode],
+    kernel_files: KernelFileCollection,
+    high_level_build_element: Build,
+    spdx_id_generator: SpdxIdGenerator,
+) -> tuple[list[File], list[Build | Relationship]]:
+    """
+    Creates the SPDX File elements of the object tree files and the build relationships between all files.
+
+    Args:
+        cmd_graph_nodes: Unique nodes of the dependency graph of a kernel build in breadth-first order.
+        kernel_files: Collection of categorized kernel files involved in the build.
+        high_level_build_element: The high-level Build element referenced by the build graph.
+        spdx_id_generator: Generator for unique SPDX IDs of the build graph.
+
+    Returns:
+        Tuple of (build file elements, Build and Relationship elements).
+    """
+    build_file_elements = [file.spdx_file_element for file in kernel_files.build.values()]
+    file_relationships = _file_relationships(
+        cmd_graph_nodes=cmd_graph_nodes,
+        file_elements=_spdx_file_elements(kernel_files),
+        high_level_build_element=high_level_build_element,
+        spdx_id_generator=spdx_id_generator,
+    )
+    return build_file_elements, file_relationships
+
+
+def _build_namespace_map(spdx_id_generators: SpdxIdGeneratorCollection, include_source: bool) -> list[NamespaceMap]:
+    """
+    Creates the namespace map of the build document.
+
+    Args:
+        spdx_id_generators: Collection of generators for SPDX element IDs.
+        include_source: Whether source files are referenced from the source document
+            and the source namespace therefore needs to be mapped.
+
+    Returns:
+        list[NamespaceMap]: Namespace maps for all generators that use a prefix.
+    """
+    if include_source:
+        return spdx_id_generators.namespace_maps(
+            spdx_id_generators.build, spdx_id_generators.source, spdx_id_generators.output, spdx_id_generators.base
+        )
+    return spdx_id_generators.namespace_maps(
+        spdx_id_generators.build, spdx_id_generators.output, spdx_id_generators.base
+    )
+
+
+def _spdx_file_elements(kernel_files: KernelFileCollection) -> dict[PathStr, File]:
+    """Maps the absolute path of every kernel file to its SPDX File element."""
+    return {
+        path: file.spdx_file_element
+        for path, file in chain(
+            kernel_files.source.items(),
+            kernel_files.build.items(),
+            kernel_files.output.items(),
+            kernel_files.external.items(),
+        )
+    }
+
+
 def _file_relationships(
-    cmd_graph: CmdGraph,
+    cmd_graph_nodes: list[CmdGraphNode],
     file_elements: Mapping[PathStr, File],
     high_level_build_element: Build,
     spdx_id_generator: SpdxIdGenerator,
@@ -241,7 +282,7 @@ def _file_relationships(
     relationships in the cmd graph.
 
     Args:
-        cmd_graph: The dependency graph of a kernel build.
+        cmd_graph_nodes: Unique nodes of the dependency graph of a kernel build in breadth-first order.
         file_elements: Mapping of filesystem paths (PathStr) to their
             corresponding SPDX File elements.
         high_level_build_element: The SPDX Build element representing the overall build process/root.
@@ -261,58 +302,69 @@ def _file_relationships(
     # Create a relationship between each node (output file)
     # and its children (input files)
     build_and_relationship_elements: list[Build | Relationship] = [high_level_build_ancestorOf_relationship]
-    for node in cmd_graph:
+    # bound methods are looked up once instead of once per node
+    generate_id = spdx_id_generator.generate
+    append_element = build_and_relationship_elements.append
+    append_ancestor = high_level_build_ancestorOf_relationship.to.append
+    for node in cmd_graph_nodes:
+        node_file_element = file_elements[node.absolute_path]
+
         # .cmd file dependencies
-        if node.cmd_file is not None:
+        cmd_file = node.cmd_file
+        if cmd_file is not None:
             build_element = Build(
-                spdxId=spdx_id_generator.generate(),
+                spdxId=generate_id(),
                 build_buildType=high_level_build_element.build_buildType,
                 build_buildId=high_level_build_element.build_buildId,
-                comment=node.cmd_file.savedcmd,
+                comment=cmd_file.savedcmd,
             )
-            build_and_relationship_elements.append(build_element)
+            append_element(build_element)
 
-            if node.cmd_file_dependencies:
+            cmd_file_dependencies = node.cmd_file_dependencies
+            if cmd_file_dependencies:
                 hasInput_relationship = Relationship(
-                    spdxId=spdx_id_generator.generate(),
+                    spdxId=generate_id(),
                     relationshipType="hasInput",
                     from_=build_element,
-                    to=[file_elements[dep.absolute_path] for dep in node.cmd_file_dependencies],
+                    to=[file_elements[dep.absolute_path] for dep in cmd_file_dependencies],
                 )
-                build_and_relationship_elements.append(hasInput_relationship)
+                append_element(hasInput_relationship)
 
             hasOutput_relationship = Relationship(
-                spdxId=spdx_id_generator.generate(),
+                spdxId=generate_id(),
                 relationshipType="hasOutput",
                 from_=build_element,
-                to=[file_elements[node.absolute_path]],
+                to=[node_file_element],
             )
-            build_and_relationship_elements.append(hasOutput_relationship)
+            append_element(hasOutput_relationship)
 
-            high_level_build_ancestorOf_relationship.to.append(build_element)
+            append_ancestor(build_element)
 
         # incbin dependencies
-        if len(node.incbin_dependencies) > 0:
+        incbin_dependencies = node.incbin_dependencies
+        if incbin_dependencies:
             incbin_dependsOn_relationship = Relationship(
-                spdxId=spdx_id_generator.generate(),
+                spdxId=generate_id(),
                 relationshipType="dependsOn",
-                comment="\n".join([incbin_dependency.full_statement for incbin_dependency in node.incbin_dependencies]),
-                from_=file_elements[node.absolute_path],
-                to=[
-                    file_elements[incbin_dependency.node.absolute_path]
-                    for incbin_dependency in node.incbin_dependencies
-                ],
+                comment=(
+                    incbin_dependencies[0].full_statement
+                    if len(incbin_dependencies) == 1
+                    else "\n".join([incbin_dependency.full_statement for incbin_dependency in incbin_dependencies])
+                ),
+                from_=node_file_element,
+                to=[file_elements[incbin_dependency.node.absolute_path] for incbin_dependency in incbin_dependencies],
             )
-            build_and_relationship_elements.append(incbin_dependsOn_relationship)
+            append_element(incbin_dependsOn_relationship)
 
         # hardcoded dependencies
-        if len(node.hardcoded_dependencies) > 0:
+        hardcoded_dependencies = node.hardcoded_dependencies
+        if hardcoded_dependencies:
             hardcoded_dependency_relationship = Relationship(
-                spdxId=spdx_id_generator.generate(),
+                spdxId=generate_id(),
                 relationshipType="dependsOn",
-                from_=file_elements[node.absolute_path],
-                to=[file_elements[n.absolute_path] for n in node.hardcoded_dependencies],
+                from_=node_file_element,
+                to=[file_elements[n.absolute_path] for n in hardcoded_dependencies],
             )
-            build_and_relationship_elements.append(hardcoded_dependency_relationship)
+            append_element(hardcoded_dependency_relationship)
 
     return build_and_relationship_elements
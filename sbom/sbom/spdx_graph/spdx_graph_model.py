@@ -1,13 +1,14 @@
 # SPDX-License-Identifier: GPL-2.0-only OR MIT
 # Copyright (C) 2025 TNG Technology Consulting GmbH
 
-from dataclasses import dataclass
-from sbom.spdx.core import CreationInfo, SoftwareAgent, SpdxDocument, SpdxObject
+from dataclasses import dataclass, field
+from typing import Iterator
+from sbom.spdx.core import CreationInfo, NamespaceMap, SoftwareAgent, SpdxDocument, SpdxObject
 from sbom.spdx.software import Sbom
 from sbom.spdx.spdxId import SpdxIdGenerator
 
 
-@dataclass
+@dataclass(slots=True)
 class SpdxGraph:
     """Represents the complete graph of a single SPDX document."""
 
@@ -16,17 +17,18 @@ class SpdxGraph:
     creation_info: CreationInfo
     sbom: Sbom
 
+    def __iter__(self) -> Iterator[SpdxObject]:
+        yield self.spdx_document
+        yield self.agent
+        yield self.creation_info
+        yield self.sbom
+        yield from self.sbom.element
+
     def to_list(self) -> list[SpdxObject]:
-        return [
-            self.spdx_document,
-            self.agent,
-            self.creation_info,
-            self.sbom,
-            *self.sbom.element,
-        ]
+        return [self.spdx_document, self.agent, self.creation_info, self.sbom] + self.sbom.element
 
 
-@dataclass
+@dataclass(slots=True)
 class SpdxIdGeneratorCollection:
     """Holds SPDX ID generators for different document types to ensure globally unique SPDX IDs."""
 
@@ -34,3 +36,25 @@ class SpdxIdGeneratorCollection:
     source: SpdxIdGenerator
     build: SpdxIdGenerator
     output: SpdxIdGenerator
+
+    _namespace_maps: dict[SpdxIdGenerator, NamespaceMap] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    """NamespaceMap of each prefixed generator, shared by all documents referencing its namespace."""
+
+    def namespace_maps(self, *generators: SpdxIdGenerator) -> list[NamespaceMap]:
+        """
+        Returns the namespace maps of the given generators, skipping generators without a prefix.
+        Each generator's NamespaceMap is created once and reused by every document.
+        """
+        namespace_maps: list[NamespaceMap] = []
+        for generator in generators:
+            if generator.prefix is None:
+                continue
+            namespace_map = self._namespace_maps.get(generator)
+            if namespace_map is None:
+                namespace_map = self._namespace_maps[generator] = NamespaceMap(
+                    prefix=generator.prefix, namespace=generator.namespace
+                )
+            namespace_maps.append(namespace_map)
+        return namespace_maps
@@ -3,11 +3,12 @@
 
 from dataclasses import dataclass
 import os
-from typing import Protocol
+from typing import Iterable, Protocol
+from sbom.config import FileHash
 from sbom.environment import Environment
 from sbom.path_utils import PathStr
 from sbom.spdx.build import Build
-from sbom.spdx.core import DictionaryEntry, NamespaceMap, Relationship, SpdxDocument
+from sbom.spdx.core import DictionaryEntry, Element, Relationship, SpdxDocument
 from sbom.spdx.simplelicensing import LicenseExpression
 from sbom.spdx.software import File, Package, Sbom
 from sbom.spdx.spdxId import SpdxIdGenerator
@@ -24,9 +25,10 @@ class SpdxOutputGraphConfig(Protocol):
     package_license: str
     package_version: str | None
     package_copyright_text: str | None
+    file_hashes: list[FileHash]
 
 
-@dataclass
+@dataclass(slots=True)
 class SpdxOutputGraph(SpdxGraph):
     """SPDX graph representing distributable output files"""
 
@@ -35,14 +37,14 @@ class SpdxOutputGraph(SpdxGraph):
     @classmethod
     def create(
         cls,
-        root_files: list[KernelFile],
+        root_files: Iterable[KernelFile],
         shared_elements: SharedSpdxElements,
         spdx_id_generators: SpdxIdGeneratorCollection,
         config: SpdxOutputGraphConfig,
     ) -> "SpdxOutputGraph":
         """
         Args:
-            root_files: List of distributable output files which act as roots
+            root_files: Distributable output files which act as roots
                 of the dependency graph.
             shared_elements: Shared SPDX elements used across multiple documents.
             spdx_id_generators: Collection of SPDX ID generators.
@@ -54,18 +56,14 @@ class SpdxOutputGraph(SpdxGraph):
         # SpdxDocument
         spdx_document = SpdxDocument(
             spdxId=spdx_id_generators.output.generate(),
-            profileConformance=["core", "software", "build", "simpleLicensing"],
-            namespaceMap=[
-                NamespaceMap(prefix=generator.prefix, namespace=generator.namespace)
-                for generator in [spdx_id_generators.output, spdx_id_generators.base]
-                if generator.prefix is not None
-            ],
+            profileConformance=("core", "software", "build", "simpleLicensing"),
+            namespaceMap=spdx_id_generators.namespace_maps(spdx_id_generators.output, spdx_id_generators.base),
         )
 
         # Sbom
         sbom = Sbom(
             spdxId=spdx_id_generators.output.generate(),
-            software_sbomType=["build"],
+            software_sbomType=("build",),
         )
 
         # High-level Build elements
@@ -75,6 +73,7 @@ class SpdxOutputGraph(SpdxGraph):
             src_tree=config.src_tree,
             spdx_id_generators=spdx_id_generators,
             is_output=True,
+            file_hashes=config.file_hashes,
         ).spdx_file_element
         high_level_build_element, high_level_build_element_hasOutput_relationship = _high_level_build_elements(
             config.build_type,
@@ -87,44 +86,57 @@ class SpdxOutputGraph(SpdxGraph):
         root_file_elements: list[File] = [file.spdx_file_element for file in root_files]
 
         # Package elements
-        package_elements = [
-            Package(
-                spdxId=spdx_id_generators.output.generate(),
+        arch = Environment.ARCH() or Environment.SRCARCH()
+        package_comment = f"Architecture={arch}" if arch else None
+        # Reserve the ID ranges up front so that packages and their relationships can be built in a single pass
+        # while keeping the ID order packages, distribution artifacts, license expression, declared licenses.
+        output_generator = spdx_id_generators.output
+        package_ids = output_generator.generate_many(len(root_file_elements))
+        distribution_ids = output_generator.generate_many(len(root_file_elements))
+        package_license_expression = LicenseExpression(
+            spdxId=output_generator.generate(),
+            simplelicensing_licenseExpression=config.package_license,
+        )
+        license_ids = output_generator.generate_many(len(root_file_elements))
+        # Shared by all hasDeclaredLicense relationships, which never modify their targets
+        package_license_expression_targets: list[Element] = [package_license_expression]
+
+        package_elements: list[Element] = []
+        package_hasDistributionArtifact_file_relationships: list[Element] = []
+        package_hasDeclaredLicense_relationships: list[Element] = []
+        for file, package_id, distribution_id, license_id in zip(
+            root_file_elements, package_ids, distribution_ids, license_ids, strict=True
+        ):
+            package = Package(
+                spdxId=package_id,
                 name=_get_package_name(file.name),
                 software_packageVersion=config.package_version,
                 software_copyrightText=config.package_copyright_text,
-                comment=f"Architecture={arch}" if (arch := Environment.ARCH() or Environment.SRCARCH()) else None,
+                comment=package_comment,
                 software_primaryPurpose=file.software_primaryPurpose,
             )
-            for file in root_file_elements
-        ]
-        package_hasDistributionArtifact_file_relationships = [
-            Relationship(
-                spdxId=spdx_id_generators.output.generate(),
-                relationshipType="hasDistributionArtifact",
-                from_=package,
-                to=[file],
+            package_elements.append(package)
+            package_hasDistributionArtifact_file_relationships.append(
+                Relationship(
+                    spdxId=distribution_id,
+                    relationshipType="hasDistributionArtifact",
+                    from_=package,
+                    to=[file],
+                )
             )
-            for package, file in zip(package_elements, root_file_elements)
-        ]
-        package_license_expression = LicenseExpression(
-            spdxId=spdx_id_generators.output.generate(),
-            simplelicensing_licenseExpression=config.package_license,
-        )
-        package_hasDeclaredLicense_relationships = [
-            Relationship(
-                spdxId=spdx_id_generators.output.generate(),
-                relationshipType="hasDeclaredLicense",
-                from_=package,
-                to=[package_license_expression],
+            package_hasDeclaredLicense_relationships.append(
+                Relationship(
+                    spdxId=license_id,
+                    relationshipType="hasDeclaredLicense",
+                    from_=package,
+                    to=package_license_expression_targets,
+                )
             )
-            for package in package_elements
-        ]
 
         # Update relationships
-        spdx_document.rootElement = [sbom]
+        spdx_document.rootElement = (sbom,)
 
-        sbom.rootElement = [*package_elements]
+        sbom.rootElement = package_elements
         sbom.element = [
             config_source_element,
             high_level_build_element,
@@ -148,13 +160,15 @@ class SpdxOutputGraph(SpdxGraph):
         return output_graph
 
 
+KERNEL_FILENAMES = frozenset(["bzImage", "Image"])
+
+
 def _get_package_name(filename: str) -> str:
     """
     Generates a SPDX package name from a filename.
     Kernel images (bzImage, Image) get a descriptive name, others use the basename of the file.
     """
-    KERNEL_FILENAMES = ["bzImage", "Image"]
-    basename = os.path.basename(filename)
+    basename = filename.rpartition(os.sep)[2]
     return f"Linux Kernel ({basename})" if basename in KERNEL_FILENAMES else basename
 
 
@@ -2,8 +2,9 @@
 # Copyright (C) 2025 TNG Technology Consulting GmbH
 
 from dataclasses import dataclass
+from typing import Iterable
 from sbom.spdx import SpdxIdGenerator
-from sbom.spdx.core import Element, NamespaceMap, Relationship, SpdxDocument
+from sbom.spdx.core import Element, Relationship, SpdxDocument
 from sbom.spdx.simplelicensing import LicenseExpression
 from sbom.spdx.software import File, Sbom
 from sbom.spdx_graph.kernel_file import KernelFile
@@ -11,7 +12,7 @@ from sbom.spdx_graph.shared_spdx_elements import SharedSpdxElements
 from sbom.spdx_graph.spdx_graph_model import SpdxGraph, SpdxIdGeneratorCollection
 
 
-@dataclass
+@dataclass(slots=True)
 class SpdxSourceGraph(SpdxGraph):
     """SPDX graph representing source files"""
 
@@ -36,18 +37,14 @@ class SpdxSourceGraph(SpdxGraph):
         # SpdxDocument
         source_spdx_document = SpdxDocument(
             spdxId=spdx_id_generators.source.generate(),
-            profileConformance=["core", "software", "simpleLicensing"],
-            namespaceMap=[
-                NamespaceMap(prefix=generator.prefix, namespace=generator.namespace)
-                for generator in [spdx_id_generators.source, spdx_id_generators.base]
-                if generator.prefix is not None
-            ],
+            profileConformance=("core", "software", "simpleLicensing"),
+            namespaceMap=spdx_id_generators.namespace_maps(spdx_id_generators.source, spdx_id_generators.base),
         )
 
         # Sbom
         source_sbom = Sbom(
             spdxId=spdx_id_generators.source.generate(),
-            software_sbomType=["source"],
+            software_sbomType=("source",),
         )
 
         # Src Tree Elements
@@ -73,8 +70,8 @@ class SpdxSourceGraph(SpdxGraph):
         )
 
         # Update relationships
-        source_spdx_document.rootElement = [source_sbom]
-        source_sbom.rootElement = [src_tree_element]
+        source_spdx_document.rootElement = (source_sbom,)
+        source_sbom.rootElement = (src_tree_element,)
         source_sbom.element = [
             src_tree_element,
             src_tree_contains_relationship,
@@ -95,36 +92,43 @@ class SpdxSourceGraph(SpdxGraph):
 
 
 def source_file_license_elements(
-    source_files: list[KernelFile], spdx_id_generator: SpdxIdGenerator
+    source_files: Iterable[KernelFile], spdx_id_generator: SpdxIdGenerator
 ) -> tuple[list[LicenseExpression], list[Relationship]]:
     """
     Creates SPDX license expressions and links them to the given source files
     via hasDeclaredLicense relationships.
 
     Args:
-        source_files: List of files within the kernel source tree.
+        source_files: Files within the kernel source tree.
         spdx_id_generator: Generator for unique SPDX IDs.
 
     Returns:
         Tuple of (license expressions, hasDeclaredLicense relationships).
     """
     license_expressions: dict[str, LicenseExpression] = {}
+    licensed_files: list[tuple[KernelFile, LicenseExpression]] = []
     for file in source_files:
-        if file.license_identifier is None or file.license_identifier in license_expressions:
+        license_identifier = file.license_identifier
+        if license_identifier is None:
             continue
-        license_expressions[file.license_identifier] = LicenseExpression(
-            spdxId=spdx_id_generator.generate(),
-            simplelicensing_licenseExpression=file.license_identifier,
-        )
-
+        license_expression = license_expressions.get(license_identifier)
+        if license_expression is None:
+            license_expression = license_expressions[license_identifier] = LicenseExpression(
+                spdxId=spdx_id_generator.generate(),
+                simplelicensing_licenseExpression=license_identifier,
+            )
+        licensed_files.append((file, license_expression))
+
+    # Relationship IDs are generated after all license expression IDs to keep the numbering stable
     source_file_license_relationships = [
         Relationship(
-            spdxId=spdx_id_generator.generate(),
+            spdxId=spdx_id,
             relationshipType="hasDeclaredLicense",
             from_=file.spdx_file_element,
-            to=[license_expressions[file.license_identifier]],
+            to=[license_expression],
+        )
+        for spdx_id, (file, license_expression) in zip(
+            spdx_id_generator.generate_many(len(licensed_files)), licensed_files, strict=True
         )
-        for file in source_files
-        if file.license_identifier is not None
     ]
-    return ([*license_expressions.values()], source_file_license_relationships)
+    return (list(license_expressions.values()), source_file_license_relationships)
@@ -2,11 +2,14 @@
 # Copyright (C) 2025 TNG Technology Consulting GmbH
 
 import os
+import re
 import unittest
 from unittest.mock import patch
 
 from sbom.cmd_graph.savedcmd_parser import parse_inputs_from_commands
 from sbom.cmd_graph.savedcmd_parser.command_parser_registry import CommandParserRegistry
+from sbom.cmd_graph.savedcmd_parser.command_splitter import split_commands
+from sbom.cmd_graph.savedcmd_parser.savedcmd_parser import DEFAULT_COMMAND_PARSER_REGISTRY
 import sbom.sbom_logging as sbom_logging
 
 
@@ -18,6 +21,14 @@ class TestSavedCmdParser(unittest.TestCase):
         self.assertEqual(parsed, target)
         errors = sbom_logging._error_logger._message_counts # type: ignore
         self.assertEqual(errors, {})
+        self._assert_registry_match(cmd, registry or DEFAULT_COMMAND_PARSER_REGISTRY)
+
+    def _assert_registry_match(self, cmd: str, registry: CommandParserRegistry) -> None:
+        # the combined registry pattern must select the same parser as trying each entry in order
+        for single_command in split_commands(cmd):
+            if isinstance(single_command, str):
+                expected_parser = next((parser for pattern, parser in registry if pattern.match(single_command)), None)
+                self.assertIs(registry.match(single_command), expected_parser)
 
     # Compound command tests
     def test_dd_cat(self):
@@ -439,5 +450,41 @@ class TestSavedCmdParser(unittest.TestCase):
         self._assert_parsing(cmd, expected)
 
 
+class TestCommandParserRegistry(unittest.TestCase):
+    def _assert_match(self, patterns: list[re.Pattern[str]], command: str, expected_index: int | None) -> None:
+        parsers = [lambda c, i=i: [str(i)] for i in range(len(patterns))]
+        registry = CommandParserRegistry(list(zip(patterns, parsers)))
+        matched_parser = registry.match(command)
+        self.assertIs(matched_parser, None if expected_index is None else parsers[expected_index])
+
+    def test_match_first_matching_entry(self):
+        patterns = [re.compile(r"^gcc\b"), re.compile(r"^g"), re.compile(r"^gcc")]
+        self._assert_match(patterns, "gcc -c a.c", 0)
+        self._assert_match(patterns, "gzip a", 1)
+        self._assert_match(patterns, "ld a.o", None)
+
+    def test_match_with_backreference(self):
+        patterns = [re.compile(r"(a)x"), re.compile(r"(b)\1")]
+        self._assert_match(patterns, "bb", 1)
+        self._assert_match(patterns, "ba", None)
+
+    def test_match_with_named_groups(self):
+        patterns = [re.compile(r"(?P<tool>a)x"), re.compile(r"(?P<tool>b)"), re.compile(r"(?P<_0>c)")]
+        self._assert_match(patterns, "b", 1)
+        self._assert_match(patterns, "c", 2)
+
+    def test_match_with_flags(self):
+        patterns = [
+            re.compile(r"a  # verbose comment", re.VERBOSE),
+            re.compile(r"\w+$", re.ASCII),
+            re.compile(r"b.c", re.DOTALL),
+            re.compile(r"(?i)d"),
+        ]
+        self._assert_match(patterns, "a", 0)
+        self._assert_match(patterns, "é", None)
+        self._assert_match(patterns, "b\nc", 2)
+        self._assert_match(patterns, "D!", 3)
+
+
 if __name__ == "__main__":
     unittest.main()
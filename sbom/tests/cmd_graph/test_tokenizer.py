@@ -0,0 +1,28 @@
+# SPDX-License-Identifier: GPL-2.0-only OR MIT
+# Copyright (C) 2025 TNG Technology Consulting GmbH
+
+import shlex
+import unittest
+
+from sbom.cmd_graph.savedcmd_parser.tokenizer import split_shell_words
+
+
+class TestTokenizer(unittest.TestCase):
+    def test_split_shell_words(self):
+        test_cases: list[str] = [
+            "",
+            "  \t\n",
+            "gcc -c -o init/main.o ../init/main.c",
+            "gcc -DKBUILD_MODFILE='\"init/main\"' -DKBUILD_BASENAME='\"main\"' ../init/main.c",
+            'echo "a \\"quoted\\" \\$word" \'single \\ quoted\'',
+            "printf '%s\\n' a\\ b c\\\\d",
+            'sed -e "s/\\\\/x/" ""',
+            "rm -f a''b \"\"c",
+        ]
+        for command in test_cases:
+            self.assertEqual(split_shell_words(command), shlex.split(command))
+
+    def test_split_shell_words_malformed(self):
+        for command in ["echo 'unclosed", 'echo "unclosed', "echo trailing\\"]:
+            with self.assertRaises(ValueError):
+                split_shell_words(command)
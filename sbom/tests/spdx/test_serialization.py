@@ -0,0 +1,36 @@
+# SPDX-License-Identifier: GPL-2.0-only OR MIT
+# Copyright (C) 2025 TNG Technology Consulting GmbH
+
+import json
+import unittest
+from pathlib import Path
+import tempfile
+from sbom.spdx.core import NamespaceMap, Relationship, SpdxDocument, SpdxObject
+from sbom.spdx.serialization import JsonLdSpdxDocument
+from sbom.spdx.software import File
+
+
+class TestJsonLdSpdxDocument(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.output_path = Path(self.tmpdir.name) / "sbom.spdx.json"
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_save_matches_to_dict(self):
+        spdx_document = SpdxDocument(
+            spdxId="p:0", namespaceMap=[NamespaceMap(prefix="p", namespace="https://example.com/é/")]
+        )
+        file = File(spdxId="p:1", name='dir/"quoted"\nname')
+        relationship = Relationship(spdxId="p:2", relationshipType="contains", from_=file, to=[file])
+        graph: list[SpdxObject] = [spdx_document, file, relationship]
+        document = JsonLdSpdxDocument(graph)
+
+        document.save(str(self.output_path), prettify=True)
+        self.assertEqual(self.output_path.read_text(encoding="utf-8"), json.dumps(document.to_dict(), indent=2))
+
+        document.save(str(self.output_path), prettify=False)
+        self.assertEqual(
+            self.output_path.read_text(encoding="utf-8"), json.dumps(document.to_dict(), separators=(",", ":"))
+        )
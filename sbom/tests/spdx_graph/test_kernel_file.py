@@ -4,7 +4,24 @@
 import unittest
 from pathlib import Path
 import tempfile
-from sbom.spdx_graph.kernel_file import _parse_spdx_license_identifier  # type: ignore
+from unittest.mock import patch
+import sbom.sbom_logging as sbom_logging
+from sbom.path_utils import cached_stat
+from sbom.spdx_graph.kernel_file import (  # type: ignore
+    PRIMARY_PURPOSE_RULES,
+    KernelFileLocation,
+    _build_file_element,
+    _file_digest_cache,
+    _file_metadata,
+    _get_primary_purpose,
+    _hash_file,
+    _hash_file_deduplicated,
+    _match_primary_purpose_rules,
+    _parse_spdx_license_identifier,
+    clear_file_caches,
+    prefetch_file_metadata,
+    prehash_files,
+)
 
 
 class TestKernelFile(unittest.TestCase):
@@ -25,11 +42,130 @@ class TestKernelFile(unittest.TestCase):
             ("/* SPDX-License-Identifier: GPL-2.0-or-later OR MIT */", "GPL-2.0-or-later OR MIT"),
             ("/* SPDX-License-Identifier: Apache-2.0 */\n extra text", "Apache-2.0"),
             ("<!-- SPDX-License-Identifier: GPL-2.0 -->", "GPL-2.0"),
+            ("// SPDX-License-Identifier: GPL-2.0-only\r\nint x;", "GPL-2.0-only"),
             ("int main() { return 0; }", None),
         ]
         # REUSE-IgnoreEnd
 
         for i, (file_content, expected_identifier) in enumerate(test_cases):
             file_path = self.src_tree / f"file_{i}.c"
-            file_path.write_text(file_content)
+            file_path.write_bytes(file_content.encode())
             self.assertEqual(_parse_spdx_license_identifier(str(file_path)), expected_identifier)
+
+    def test_hash_file(self):
+        file_path = self.src_tree / "hello.txt"
+        file_path.write_bytes(b"hello\n")
+        file_size = file_path.stat().st_size
+        sha256 = "5891b5b522d5df086d0ff0b110fbd9d21bb4fc7163af34d08286a2e846f6be03"
+        gitoid = "ce013625030ba8dba906f756967f9e9ca394464a"
+
+        self.assertEqual(
+            _hash_file(str(file_path), file_size, ["sha256", "gitoid"]), {"sha256": sha256, "gitoid": gitoid}
+        )
+        self.assertEqual(_hash_file(str(file_path), file_size, ["gitoid"]), {"gitoid": gitoid})
+        self.assertEqual(_hash_file(str(file_path), file_size, []), {})
+
+    def test_hash_empty_file(self):
+        file_path = self.src_tree / "empty.txt"
+        file_path.write_bytes(b"")
+        self.assertEqual(
+            _hash_file(str(file_path), 0, ["sha256", "gitoid"]),
+            {
+                "sha256": "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855",
+                "gitoid": "e69de29bb2d1d6434b8b29ae775ad8c2e48c5391",
+            },
+        )
+
+    def test_clear_file_caches(self):
+        file_path = self.src_tree / "a.c"
+        file_path.write_bytes(b"old\n")
+        first = _build_file_element(str(file_path), "a.c", "p:0", KernelFileLocation.SOURCE_TREE, ["sha256"])
+        file_path.write_bytes(b"new content\n")
+        # a new run starts with CmdGraph.create, which clears the stat cache
+        cached_stat.cache_clear()
+        clear_file_caches()
+        second = _build_file_element(str(file_path), "a.c", "p:0", KernelFileLocation.SOURCE_TREE, ["sha256"])
+        expected = _hash_file(str(file_path), file_path.stat().st_size, ["sha256"])["sha256"]
+        self.assertNotEqual(first.verifiedUsing, second.verifiedUsing)
+        self.assertEqual(second.verifiedUsing[0].hashValue, expected)
+
+    def test_clear_file_caches_license_identifier(self):
+        file_path = self.src_tree / "a.c"
+        # REUSE-IgnoreStart
+        file_path.write_bytes(b"// SPDX-License-Identifier: MIT\n")
+        first = _file_metadata(str(file_path), str(self.src_tree), str(self.src_tree))
+        file_path.write_bytes(b"// SPDX-License-Identifier: GPL-2.0-only\n")
+        # REUSE-IgnoreEnd
+        clear_file_caches()
+        second = _file_metadata(str(file_path), str(self.src_tree), str(self.src_tree))
+        self.assertEqual((first[2], second[2]), ("MIT", "GPL-2.0-only"))
+
+    def test_prehash_files(self):
+        file_paths: list[str] = []
+        for i in range(4):
+            file_path = self.src_tree / f"file{i}.txt"
+            file_path.write_bytes(f"content {i}\n".encode())
+            file_paths.append(str(file_path))
+        file_paths.append(str(self.src_tree / "missing.txt"))
+
+        cache_size = len(_file_digest_cache)
+        prehash_files(file_paths, ["sha256", "gitoid"], min_files=0, max_workers=2)
+        self.assertEqual(len(_file_digest_cache), cache_size + 4)
+        for file_path in file_paths[:-1]:
+            file_stat = Path(file_path).stat()
+            expected = _hash_file(file_path, file_stat.st_size, ["sha256", "gitoid"])
+            self.assertEqual(_hash_file_deduplicated(file_path, file_stat, ["sha256", "gitoid"]), expected)
+        self.assertEqual(len(_file_digest_cache), cache_size + 4)
+
+    def test_prehash_files_without_process_pool(self):
+        file_path = self.src_tree / "file.txt"
+        file_path.write_bytes(b"content\n")
+
+        cache_size = len(_file_digest_cache)
+        with patch("sbom.spdx_graph.kernel_file.ProcessPoolExecutor", side_effect=NotImplementedError):
+            prehash_files([str(file_path)], ["sha256"], min_files=0)
+        self.assertEqual(len(_file_digest_cache), cache_size)
+
+    def test_prefetch_file_metadata(self):
+        obj_tree = self.src_tree / "kernel_build"
+        obj_tree.mkdir()
+        source_path = self.src_tree / "main.c"
+        # REUSE-IgnoreStart
+        source_path.write_bytes(b"// SPDX-License-Identifier: GPL-2.0-only\n")
+        # REUSE-IgnoreEnd
+        object_path = obj_tree / "main.o"
+        object_path.write_bytes(b"\0")
+
+        prefetch_file_metadata(
+            [str(source_path), str(object_path)], str(obj_tree), str(self.src_tree), min_files=0, max_workers=2
+        )
+        hits = _file_metadata.cache_info().hits
+        self.assertEqual(
+            _file_metadata(str(source_path), str(obj_tree), str(self.src_tree)),
+            (KernelFileLocation.SOURCE_TREE, "main.c", "GPL-2.0-only"),
+        )
+        self.assertEqual(
+            _file_metadata(str(object_path), str(obj_tree), str(self.src_tree)),
+            (KernelFileLocation.OBJ_TREE, "main.o", None),
+        )
+        self.assertEqual(_file_metadata.cache_info().hits, hits + 2)
+
+    def test_get_primary_purpose(self):
+        sbom_logging.init()
+        # the lookup tables rely on rule suffixes never containing a path separator
+        for _, suffixes, _ in PRIMARY_PURPOSE_RULES:
+            for suffix in suffixes:
+                self.assertNotIn("/", suffix)
+
+        test_cases: list[str] = [
+            "/linux/kernel_build/arch/x86/boot/Image",
+            "/linux/kernel_build/arch/arm/boot/zImage",
+            "/linux/kernel_build/vmlinux",
+            "/linux/kernel_build/arch/x86/entry/vdso/x.so.raw",
+            "/linux/kernel_build/x.raw",
+            "/linux/drivers/gpu/drm/radeon/reg_srcs/r100",
+            "/linux/kernel_build/foo.c.o",
+            "/linux/kernel_build/foo.unknown",
+        ]
+        for path in test_cases:
+            self.assertEqual(_get_primary_purpose(path), _match_primary_purpose_rules(path), path)
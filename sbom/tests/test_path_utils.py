@@ -0,0 +1,31 @@
+# SPDX-License-Identifier: GPL-2.0-only OR MIT
+# Copyright (C) 2025 TNG Technology Consulting GmbH
+
+import os
+import unittest
+from sbom.path_utils import is_relative_to, relative_path, tree_relative_path
+
+
+class TestPathUtils(unittest.TestCase):
+    def test_relative_path(self):
+        test_cases: list[tuple[str, str]] = [
+            ("/linux/kernel_build/init/main.o", "/linux/kernel_build"),
+            ("/linux/init/main.c", "/linux"),
+            ("/linux/init/main.c", "/linux/kernel_build"),
+            ("/linux", "/linux"),
+            ("/linuxfoo/main.c", "/linux"),
+            ("/usr/include/stdio.h", "/"),
+        ]
+        for path, base in test_cases:
+            self.assertEqual(relative_path(path, base), os.path.relpath(path, base))
+
+    def test_tree_relative_path(self):
+        test_cases: list[tuple[str, str]] = [
+            ("/linux/kernel_build/init/main.o", "/linux/kernel_build"),
+            ("/linux/init/main.c", "/linux/kernel_build"),
+            ("/linux", "/linux"),
+            ("/linuxfoo/main.c", "/linux"),
+        ]
+        for path, base in test_cases:
+            expected = os.path.relpath(path, base) if is_relative_to(path, base) else None
+            self.assertEqual(tree_relative_path(path, base), expected)